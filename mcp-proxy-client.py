@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+OpenProject MCP Proxy Client - Stdio to HTTP Bridge
+
+This is a lightweight proxy for stdio-only MCP clients (e.g. Claude Desktop)
+that need to talk to a remote SSE/HTTP deployment of this server.
+JSON-RPC messages are read from stdin, forwarded to the server over HTTP,
+and responses are written back to stdout.
+"""
+
+import asyncio
+import os
+import sys
+
+import aiohttp
+import orjson
+from yarl import URL
+
+# Pre-built URL object so aiohttp skips re-parsing the string on every POST
+SERVER_URL = URL(os.getenv("MCP_PROXY_SERVER_URL", "http://localhost:8000/sse"))
+API_KEY = os.getenv("MCP_PROXY_API_KEY", "")
+
+# Maximum number of requests allowed in flight before stdin reading is
+# back-pressured
+MAX_IN_FLIGHT = int(os.getenv("MCP_PROXY_MAX_IN_FLIGHT", "8"))
+
+# Opportunistic batching: messages already queued within this window are
+# coalesced into a single JSON-RPC batch array (one network round-trip for
+# N calls). Set MCP_PROXY_BATCH=0 for servers without batch support.
+BATCH_WINDOW = 0.002  # seconds
+MAX_BATCH = int(os.getenv("MCP_PROXY_MAX_BATCH", "16"))
+
+_batch_supported = os.getenv("MCP_PROXY_BATCH", "1") != "0"
+
+
+def _default_headers():
+    """Build the constant request headers applied to the shared session."""
+    headers = {
+        "Content-Type": "application/json",
+        # Advertise a long keep-alive so servers/intermediaries that expire
+        # idle connections aggressively keep our pooled connection warm;
+        # matches the connector's keepalive_timeout
+        "Connection": "keep-alive",
+        "Keep-Alive": "timeout=300, max=1000",
+    }
+    if API_KEY:
+        headers["Authorization"] = f"Bearer {API_KEY}"
+    return headers
+
+
+async def _forward(session, message):
+    """POST one JSON-RPC message and return the decoded reply, or None.
+
+    None means "write nothing to stdout": notifications (messages without
+    an id) must never be answered per JSON-RPC, and the server replies to
+    them with an empty body anyway.
+    """
+    try:
+        # Plain await + release() skips the context manager's __aexit__
+        # wind-down; the body is fully buffered by read() before release
+        response = await session.post(SERVER_URL, data=orjson.dumps(message))
+        try:
+            body = await response.read()
+        finally:
+            response.release()
+        # Empty body: the normal 202 acknowledgement of a notification
+        if not body.strip():
+            return None
+        # The endpoint is known to speak JSON; read raw bytes and parse
+        # with orjson, skipping response.json()'s content-type and
+        # charset ceremony plus the stdlib parse
+        reply = orjson.loads(body)
+        return reply if message.get("id") is not None else None
+    except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+        # JSONDecodeError covers gateways answering with HTML error pages;
+        # surface those as JSON-RPC errors, not a crash. Only id-bearing
+        # requests may be answered, so notifications swallow the error too
+        if message.get("id") is None:
+            return None
+        return {
+            "jsonrpc": "2.0",
+            "id": message.get("id"),
+            "error": {"code": -32000, "message": f"Proxy error: {e}"},
+        }
+
+
+def _order_batch_responses(batch, responses):
+    """Reorder a batch response array to match the order messages were sent."""
+    by_id = {
+        r.get("id"): r
+        for r in responses
+        if isinstance(r, dict) and r.get("id") is not None
+    }
+    ordered = []
+    for message in batch:
+        response = by_id.pop(message.get("id"), None)
+        if response is not None:
+            ordered.append(response)
+    # Responses the server produced that we could not match by id
+    ordered.extend(by_id.values())
+    return ordered
+
+
+async def _forward_batch(session, batch):
+    """Forward a batch of messages, as one JSON-RPC array when possible.
+
+    Falls back to (concurrent) per-message POSTs if the server does not
+    answer the array with a batch response, and remembers that for the rest
+    of the session.
+    """
+    global _batch_supported
+
+    if len(batch) == 1:
+        response = await _forward(session, batch[0])
+        return [] if response is None else [response]
+
+    if _batch_supported:
+        try:
+            response = await session.post(SERVER_URL, data=orjson.dumps(batch))
+            try:
+                body = await response.read()
+            finally:
+                response.release()
+            # An all-notification batch is acknowledged with an empty body
+            if not body.strip():
+                return []
+            result = orjson.loads(body)
+            if isinstance(result, list):
+                return _order_batch_responses(batch, result)
+            # Server does not speak JSON-RPC batch; stop trying
+            _batch_supported = False
+        except (aiohttp.ClientError, orjson.JSONDecodeError):
+            pass  # Fall through to per-message delivery
+
+    responses = await asyncio.gather(*(_forward(session, m) for m in batch))
+    return [r for r in responses if r is not None]
+
+
+async def _handle(session, semaphore, batch):
+    """Forward one batch, releasing the in-flight slot when done."""
+    try:
+        return await _forward_batch(session, batch)
+    finally:
+        semaphore.release()
+
+
+async def _write_responses(queue):
+    """Drain completed requests in submission order and write them to stdout.
+
+    Awaiting the queued tasks in FIFO order preserves JSON-RPC response
+    ordering on stdout even though the POSTs themselves overlap.
+    """
+    out = bytearray()
+    while True:
+        task = await queue.get()
+        if task is None:
+            break
+
+        for result in await task:
+            # orjson emits bytes, so accumulate in a byte buffer and skip
+            # the extra str -> bytes encode of sys.stdout.write
+            out += orjson.dumps(result)
+            out += b"\n"
+
+        # Flush only when no further responses are immediately pending (the
+        # client is about to wait on us) or the buffer is already large,
+        # coalescing one write+flush syscall pair across a burst of replies
+        if queue.empty() or len(out) >= 65536:
+            sys.stdout.buffer.write(out)
+            sys.stdout.buffer.flush()
+            out.clear()
+
+    if out:
+        sys.stdout.buffer.write(out)
+        sys.stdout.buffer.flush()
+
+
+async def main():
+    """Ferry JSON-RPC messages between stdin/stdout and the remote SSE server."""
+    # Explicit connector settings so keep-alive connections to the (single)
+    # server host stay pooled instead of being silently expired between
+    # messages, which would force a new TCP+TLS handshake per call.
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=16,
+        keepalive_timeout=300,
+        enable_cleanup_closed=True,
+        force_close=False,
+    )
+    loop = asyncio.get_running_loop()
+    inbox = asyncio.Queue(maxsize=MAX_IN_FLIGHT * MAX_BATCH)
+    queue = asyncio.Queue()
+    semaphore = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+    async def read_stdin():
+        """Parse stdin into the inbox via chunked reads; None marks end of input.
+
+        Chunked reads into a persistent buffer cost one allocation per burst
+        of messages instead of one str per line, and the newline split happens
+        at C level via bytes.partition.
+        """
+        # Wire stdin into the event loop so reads are truly async and never
+        # stall in-flight POSTs or the connector's keep-alive handling
+        pipe_reader = asyncio.StreamReader(loop=loop)
+        try:
+            await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(pipe_reader, loop=loop),
+                sys.stdin,
+            )
+        except (NotImplementedError, OSError, ValueError):
+            # connect_read_pipe does not support stdin everywhere (notably
+            # Windows); fall back to blocking reads in the default executor
+            pipe_reader = None
+
+        stdin = sys.stdin.buffer
+        buf = bytearray()
+        while True:
+            if pipe_reader is not None:
+                chunk = await pipe_reader.read(65536)
+            else:
+                chunk = await loop.run_in_executor(None, stdin.read1, 65536)
+            if not chunk:
+                await inbox.put(None)
+                break
+
+            buf += chunk
+            while True:
+                line, sep, rest = buf.partition(b"\n")
+                if not sep:
+                    break
+                buf = rest
+                try:
+                    # orjson accepts bytearray and tolerates whitespace,
+                    # no decode or strip() needed
+                    await inbox.put(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue
+
+    async with aiohttp.ClientSession(
+        connector=connector, headers=_default_headers()
+    ) as session:
+        writer = asyncio.create_task(_write_responses(queue))
+        reader = asyncio.create_task(read_stdin())
+        eof = False
+
+        while not eof:
+            message = await inbox.get()
+            if message is None:
+                break
+
+            # Coalesce messages that are already queued (or arrive within the
+            # batch window) into one batch; the semaphore bounds how far
+            # stdin can run ahead of the server.
+            batch = [message]
+            while len(batch) < MAX_BATCH:
+                try:
+                    message = await asyncio.wait_for(inbox.get(), BATCH_WINDOW)
+                except asyncio.TimeoutError:
+                    break
+                if message is None:
+                    eof = True
+                    break
+                batch.append(message)
+
+            await semaphore.acquire()
+            await queue.put(asyncio.create_task(_handle(session, semaphore, batch)))
+
+        await queue.put(None)
+        await writer
+        reader.cancel()
+
+
+if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass  # uvloop is optional; the default loop works everywhere
+
+    asyncio.run(main())
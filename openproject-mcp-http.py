@@ -7,6 +7,7 @@ Includes API Key authentication for user tracking.
 """
 
 import os
+import sys
 from src.server import mcp
 from src.auth import load_api_keys_from_env
 
@@ -18,10 +19,14 @@ if __name__ == "__main__":
     host = os.getenv("MCP_HTTP_HOST", "0.0.0.0")
     port = int(os.getenv("MCP_HTTP_PORT", "8000"))
 
-    print(f"🚀 Starting OpenProject MCP Server (HTTP)")
-    print(f"   Host: {host}")
-    print(f"   Port: {port}")
-    print(f"   API Keys: {len(api_keys)} loaded")
+    # One buffered write + flush instead of four locked print calls
+    sys.stdout.write(
+        f"🚀 Starting OpenProject MCP Server (HTTP)\n"
+        f"   Host: {host}\n"
+        f"   Port: {port}\n"
+        f"   API Keys: {len(api_keys)} loaded\n"
+    )
+    sys.stdout.flush()
 
     # Run with HTTP transport
     mcp.run(
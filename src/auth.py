@@ -1,7 +1,9 @@
 """Authentication middleware for HTTP transport."""
 
+import functools
 import os
-from typing import Dict, Optional
+import types
+from typing import Dict, Mapping, Optional
 
 
 class APIKeyAuth:
@@ -17,13 +19,27 @@ class APIKeyAuth:
                        If None, loads from environment variable MCP_API_KEYS
         """
         if valid_keys is None:
-            self.valid_keys = load_api_keys_from_env()
-        else:
-            self.valid_keys = valid_keys
+            valid_keys = load_api_keys_from_env()
+
+        # Keys are immutable after construction; the read-only proxy makes
+        # that explicit and protects the mapping from accidental mutation
+        self.valid_keys = types.MappingProxyType(dict(valid_keys))
+
+        # Rebind validate to the bound dict.get so the per-request hot path
+        # is a single C-level lookup with no Python frame in between
+        self.validate = self.valid_keys.get
+
+        # Boolean-only fast path for callers that don't need the user name:
+        # frozenset membership skips the value load of dict.get entirely
+        self._key_set = frozenset(self.valid_keys)
+        self.is_valid = self._key_set.__contains__
 
     def validate(self, api_key: str) -> Optional[str]:
         """Validate API key and return user name if valid.
 
+        Note: __init__ rebinds this per instance to ``valid_keys.get``;
+        this definition documents the interface (and serves type checkers).
+
         Args:
             api_key: The API key to validate
 
@@ -32,41 +48,83 @@ class APIKeyAuth:
         """
         return self.valid_keys.get(api_key)
 
+    def is_valid(self, api_key: str) -> bool:
+        """Check whether an API key is allowed, without resolving the user.
 
-def load_api_keys_from_env() -> Dict[str, str]:
-    """Load API keys from environment variable.
+        Note: __init__ rebinds this per instance to the key set's
+        ``__contains__``; this definition documents the interface.
 
-    Format: MCP_API_KEYS=key1:User1,key2:User2,key3:User3
+        Args:
+            api_key: The API key to check
 
-    Returns:
-        Dict mapping API keys to user names
-    """
-    keys_env = os.getenv("MCP_API_KEYS", "")
-    valid_keys = {}
+        Returns:
+            True if the key is valid
+        """
+        return api_key in self._key_set
 
+
+@functools.lru_cache(maxsize=1)
+def _parse_api_keys(keys_env: str) -> Mapping[str, str]:
+    """Parse the MCP_API_KEYS string, memoized on the raw env value.
+
+    The result is read-only so repeated callers share one cached mapping
+    without risking mutation of the cache.
+    """
     if not keys_env:
         print("[WARNING] No MCP_API_KEYS environment variable set. HTTP auth disabled.")
-        return valid_keys
+        return types.MappingProxyType({})
 
-    for pair in keys_env.split(","):
-        if ":" in pair:
-            key, name = pair.split(":", 1)
-            valid_keys[key.strip()] = name.strip()
+    # Single split per pair feeding a dict comprehension; malformed pairs
+    # (no colon) are skipped by the length filter
+    pairs = (pair.split(":", 1) for pair in keys_env.split(","))
+    valid_keys = {key.strip(): name.strip() for key, *name_rest in pairs
+                  for name in name_rest}
 
     print(f"[INFO] Loaded {len(valid_keys)} API keys from environment")
-    return valid_keys
+    return types.MappingProxyType(valid_keys)
 
 
-def extract_bearer_token(auth_header: str) -> Optional[str]:
+def load_api_keys_from_env() -> Mapping[str, str]:
+    """Load API keys from environment variable.
+
+    Format: MCP_API_KEYS=key1:User1,key2:User2,key3:User3
+
+    Repeated calls with an unchanged environment return the cached mapping
+    instead of re-parsing.
+
+    Returns:
+        Read-only mapping of API keys to user names
+    """
+    return _parse_api_keys(os.getenv("MCP_API_KEYS", ""))
+
+
+# Byte-level prefix for headers handed in raw from the ASGI layer
+_BEARER_PREFIX = b"Bearer "
+
+
+def extract_bearer_token(auth_header) -> Optional[str]:
     """Extract bearer token from Authorization header.
 
+    Accepts both str and bytes header values; ASGI servers deliver headers
+    as bytes, and the bytes path is a single memcmp-backed prefix check
+    with no intermediate encode.
+
     Args:
-        auth_header: Authorization header value
+        auth_header: Authorization header value (str or bytes)
 
     Returns:
         Token if found, None otherwise
     """
-    if not auth_header or not auth_header.startswith("Bearer "):
+    if not auth_header:
         return None
 
-    return auth_header[7:]  # Remove "Bearer " prefix
+    if isinstance(auth_header, (bytes, bytearray, memoryview)):
+        raw = bytes(auth_header)
+        if not raw.startswith(_BEARER_PREFIX):
+            return None
+        return raw[7:].decode("latin-1")
+
+    # removeprefix tests and strips in one C call; the length only changes
+    # when the prefix was actually there
+    token = auth_header.removeprefix("Bearer ")
+    return None if len(token) == len(auth_header) else token
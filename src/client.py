@@ -4,17 +4,34 @@ OpenProject API Client
 A comprehensive async client for OpenProject API v3 with proxy support.
 """
 
+import functools
 import os
 import json
 import logging
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import asyncio
 import aiohttp
-from urllib.parse import quote
 import base64
 import ssl
 
+from src.client_loaders import AsyncBatchLoader
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -22,6 +39,89 @@ logger = logging.getLogger(__name__)
 __version__ = "2.0.0"
 
 
+@functools.lru_cache(maxsize=4096)
+def _parent_filter_json(parent_id: int, descendants: bool) -> str:
+    """Memoized compact filter JSON for child/descendant listings.
+
+    Hierarchy browsing re-requests the same handful of parents; caching
+    the serialized filter turns the per-call encode into a dict lookup.
+    """
+    key = "descendantsOf" if descendants else "parent"
+    return json.dumps(
+        [{key: {"operator": "=", "values": [str(parent_id)]}}],
+        separators=(",", ":"),
+    )
+
+
+# Sparse fieldset for child listings: only what the list formatters
+# actually render, plus pagination metadata. Extend here if a tool needs
+# more fields from /work_packages collections.
+_WP_LIST_SELECT = ",".join((
+    "elements/id",
+    "elements/subject",
+    "elements/startDate",
+    "elements/dueDate",
+    "elements/_links/status",
+    "elements/_links/type",
+    "elements/_links/priority",
+    "elements/_links/assignee",
+    "elements/_links/parent",
+    "total",
+    "count",
+    "pageSize",
+    "offset",
+))
+
+
+@functools.lru_cache(maxsize=1024)
+def _href(resource: str, resource_id) -> Dict[str, str]:
+    """Memoized link dict for /api/v3/{resource}/{resource_id}.
+
+    Batch imports allocate thousands of these tiny dicts; caching them
+    shares one instance per id. Cached dicts are handed into payloads
+    read-only — never mutate them. (A mappingproxy would enforce that,
+    but orjson only serializes plain dicts.)
+    """
+    return {"href": f"/api/v3/{resource}/{resource_id}"}
+
+
+# Human-readable hints appended to API error messages, keyed by status
+_ERROR_HINTS = {
+    401: "Authentication failed. Please check your API key.",
+    403: "Access denied. The user lacks required permissions.",
+    404: "Resource not found. Please verify the URL and resource exists.",
+    407: "Proxy authentication required.",
+    500: "Internal server error. Please try again later.",
+    502: "Bad gateway. The server or proxy is not responding correctly.",
+    503: "Service unavailable. The server might be under maintenance.",
+}
+
+# Shared across client instances: building a default context loads and
+# parses the whole system trust store, which is worth doing exactly once
+# per process
+_SSL_CTX: Optional[ssl.SSLContext] = None
+
+
+def _default_ssl_context() -> ssl.SSLContext:
+    """Return the lazily created, process-wide default SSL context."""
+    global _SSL_CTX
+    if _SSL_CTX is None:
+        _SSL_CTX = ssl.create_default_context()
+    return _SSL_CTX
+
+
+_project_href = functools.partial(_href, "projects")
+_type_href = functools.partial(_href, "types")
+_status_href = functools.partial(_href, "statuses")
+_priority_href = functools.partial(_href, "priorities")
+_user_href = functools.partial(_href, "users")
+_group_href = functools.partial(_href, "groups")
+_role_href = functools.partial(_href, "roles")
+_version_href = functools.partial(_href, "versions")
+_work_package_href = functools.partial(_href, "work_packages")
+_activity_href = functools.partial(_href, "time_entries/activities")
+
+
 class OpenProjectClient:
     """Client for the OpenProject API v3 with optional proxy support"""
 
@@ -38,25 +138,100 @@ class OpenProjectClient:
         self.api_key = api_key
         self.proxy = proxy
 
+        # Precomputed API root so _request does one concatenation per call
+        # instead of re-formatting the base URL every time
+        self._api_root = f"{self.base_url}/api/v3"
+
         # Setup headers with Basic Auth
         self.headers = {
             "Authorization": f"Basic {self._encode_api_key()}",
             "Content-Type": "application/json",
             "Accept": "application/json",
+            # List endpoints compress ~5-10x; ask for it explicitly so no
+            # header override path can silently drop it
+            "Accept-Encoding": "gzip, deflate",
             "User-Agent": f"OpenProject-MCP/{__version__}",
         }
 
+        # One SSL context and (lazily created) session for the client's
+        # lifetime; reconnecting per request would pay a TCP+TLS handshake
+        # on every call
+        self._ssl_context = _default_ssl_context()
+        self._timeout = aiohttp.ClientTimeout(total=30)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Caps concurrent in-flight requests so bulk helpers fanning out
+        # with asyncio.gather stay within the connector's per-host limit;
+        # sized from the same env knob so raising the pool actually
+        # raises usable concurrency instead of queueing on this gate
+        self._request_semaphore = asyncio.Semaphore(
+            int(os.getenv("OPENPROJECT_MAX_CONNECTIONS_PER_HOST", "32"))
+        )
+
+        # TTL cache for slow-changing lookup tables (statuses, types, ...):
+        # key -> (monotonic timestamp, orjson-encoded response bytes)
+        self._meta_cache: Dict[str, tuple] = {}
+
+        # Lazily built loader that coalesces concurrent work package
+        # lookups into batched filter queries
+        self._work_package_loader: Optional[AsyncBatchLoader] = None
+
         logger.info(f"OpenProject Client initialized for: {self.base_url}")
         if self.proxy:
             logger.info(f"Using proxy: {self.proxy}")
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared ClientSession, creating it on first use.
+
+        Created lazily so it binds to the running event loop, and kept for
+        the client's lifetime so keep-alive connections are reused.
+        """
+        if self._session is None or self._session.closed:
+            # Pool sizes are env-tunable for highly parallel workloads
+            # (e.g. get_work_packages_bulk against a beefy deployment)
+            connector = aiohttp.TCPConnector(
+                ssl=self._ssl_context,
+                limit=int(os.getenv("OPENPROJECT_MAX_CONNECTIONS", "64")),
+                limit_per_host=int(
+                    os.getenv("OPENPROJECT_MAX_CONNECTIONS_PER_HOST", "32")
+                ),
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            # Auth and content headers are constant, so install them as
+            # session defaults instead of merging a dict on every request;
+            # auto_decompress keeps gzip inflation in aiohttp's C zlib path
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._timeout,
+                headers=self.headers,
+                auto_decompress=True,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "OpenProjectClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
     def _encode_api_key(self) -> str:
         """Encode API key for Basic Auth"""
         credentials = f"apikey:{self.api_key}"
         return base64.b64encode(credentials.encode()).decode()
 
     async def _request(
-        self, method: str, endpoint: str, data: Optional[Dict] = None
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
     ) -> Dict:
         """
         Execute an API request.
@@ -65,6 +240,8 @@ class OpenProjectClient:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             data: Optional request body data
+            params: Optional query parameters, escaped by yarl's
+                    C-accelerated URL builder
 
         Returns:
             Dict: Response data from the API
@@ -72,78 +249,197 @@ class OpenProjectClient:
         Raises:
             Exception: If the request fails
         """
-        url = f"{self.base_url}/api/v3{endpoint}"
+        url = self._api_root + endpoint
 
-        logger.debug(f"API Request: {method} {url}")
-        if data:
-            logger.debug(f"Request body: {json.dumps(data, indent=2)}")
+        # Lazy %-args let the logger skip formatting below DEBUG; the
+        # indented dump is additionally gated since it serializes eagerly
+        logger.debug("API Request: %s %s", method, url)
+        if data and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body: %s", json.dumps(data, indent=2))
 
-        # Configure SSL and timeout
-        ssl_context = ssl.create_default_context()
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        timeout = aiohttp.ClientTimeout(total=30)
+        session = self._get_session()
 
-        async with aiohttp.ClientSession(
-            connector=connector, timeout=timeout
-        ) as session:
-            try:
-                # Build request parameters
-                request_params = {
-                    "method": method,
-                    "url": url,
-                    "headers": self.headers,
-                    "json": data,
-                }
+        try:
+            # Headers live on the session; only the body (orjson bytes) and
+            # optional proxy vary per call
+            async with self._request_semaphore, session.request(
+                method,
+                url,
+                data=_json_dumps(data) if data is not None else None,
+                params=params,
+                proxy=self.proxy,
+            ) as response:
+                # Raw bytes: orjson parses them directly, so the charset
+                # detection and full-body str decode of .text() is skipped
+                body = await response.read()
+
+                logger.debug("Response status: %s", response.status)
+
+                # Parse response; checking the content type up front avoids
+                # raise/catch overhead when error pages come back as HTML
+                if body and "json" in response.content_type:
+                    response_json = _json_loads(body)
+                else:
+                    if body:
+                        logger.error(
+                            "Non-JSON response (%s): %.200s",
+                            response.content_type,
+                            body.decode(errors="replace"),
+                        )
+                    response_json = {}
 
-                # Add proxy if configured
-                if self.proxy:
-                    request_params["proxy"] = self.proxy
+                # Handle errors (decode only on this cold path)
+                if response.status >= 400:
+                    error_msg = self._format_error_message(
+                        response.status, body.decode(errors="replace")
+                    )
+                    raise Exception(error_msg)
 
-                async with session.request(**request_params) as response:
-                    response_text = await response.text()
+                return response_json
 
-                    logger.debug(f"Response status: {response.status}")
+        except aiohttp.ClientError as e:
+            logger.error(f"Network error: {str(e)}")
+            raise Exception(f"Network error accessing {url}: {str(e)}")
 
-                    # Parse response
-                    try:
-                        response_json = (
-                            json.loads(response_text) if response_text else {}
-                        )
-                    except json.JSONDecodeError:
-                        logger.error(f"Invalid JSON response: {response_text[:200]}...")
-                        response_json = {}
-
-                    # Handle errors
-                    if response.status >= 400:
-                        error_msg = self._format_error_message(
-                            response.status, response_text
+    async def _request_no_body(self, method: str, endpoint: str) -> bool:
+        """
+        Execute a request whose response body is irrelevant (DELETEs).
+
+        Unlike _request, this never awaits or parses the body on success —
+        DELETE responses are typically empty 204s, so reading to EOF and
+        allocating a buffer per call is pure overhead in bulk cleanups.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+
+        Returns:
+            bool: True on success
+
+        Raises:
+            Exception: If the request fails
+        """
+        url = self._api_root + endpoint
+
+        logger.debug("API Request: %s %s", method, url)
+
+        session = self._get_session()
+
+        try:
+            async with self._request_semaphore, session.request(
+                method, url, proxy=self.proxy
+            ) as response:
+                if response.status >= 400:
+                    body = await response.read()
+                    raise Exception(
+                        self._format_error_message(
+                            response.status, body.decode(errors="replace")
                         )
-                        raise Exception(error_msg)
+                    )
+                return True
+        except aiohttp.ClientError as e:
+            logger.error(f"Network error: {str(e)}")
+            raise Exception(f"Network error accessing {url}: {str(e)}")
 
-                    return response_json
+    async def _patch_with_lock(
+        self,
+        endpoint: str,
+        payload: Dict,
+        refetch,
+        lock_version: Optional[int] = None,
+    ) -> Dict:
+        """
+        PATCH a resource with optimistic-locking conflict recovery.
+
+        With a caller-supplied lock_version the PATCH goes out immediately
+        (one round-trip when the version is right). Without one the current
+        lockVersion is fetched first — guessing a stale version would turn
+        every update of a previously edited resource into PATCH → 409 →
+        refetch → PATCH, costing more than the fetch-then-patch it was
+        meant to beat. Either way a 409 (version changed under us) is
+        retried once with a freshly fetched version.
+
+        Args:
+            endpoint: API endpoint to PATCH
+            payload: Request body (lockVersion is filled in here)
+            refetch: Zero-argument coroutine function returning the current
+                     resource, used to obtain its lockVersion
+            lock_version: Known lockVersion, skipping the initial refetch
 
-            except aiohttp.ClientError as e:
-                logger.error(f"Network error: {str(e)}")
-                raise Exception(f"Network error accessing {url}: {str(e)}")
+        Returns:
+            Dict: Updated resource data
+        """
+        if lock_version is not None:
+            payload["lockVersion"] = lock_version
+        else:
+            current = await refetch()
+            payload["lockVersion"] = current.get("lockVersion", 0)
 
-    def _format_error_message(self, status: int, response_text: str) -> str:
+        try:
+            return await self._request("PATCH", endpoint, payload)
+        except Exception as e:
+            if "API Error 409" not in str(e):
+                raise
+            current = await refetch()
+            payload["lockVersion"] = current.get("lockVersion", 0)
+            return await self._request("PATCH", endpoint, payload)
+
+    @staticmethod
+    def _format_error_message(status: int, response_text: str) -> str:
         """Format error message based on HTTP status code"""
-        base_msg = f"API Error {status}: {response_text}"
-
-        error_hints = {
-            401: "Authentication failed. Please check your API key.",
-            403: "Access denied. The user lacks required permissions.",
-            404: "Resource not found. Please verify the URL and resource exists.",
-            407: "Proxy authentication required.",
-            500: "Internal server error. Please try again later.",
-            502: "Bad gateway. The server or proxy is not responding correctly.",
-            503: "Service unavailable. The server might be under maintenance.",
-        }
+        hint = _ERROR_HINTS.get(status)
+        if hint:
+            return f"API Error {status}: {response_text}\n\n{hint}"
+        return f"API Error {status}: {response_text}"
+
+    @staticmethod
+    def _ensure_elements(result: Dict) -> Dict:
+        """Guarantee that result["_embedded"]["elements"] exists.
+
+        Collection endpoints are normalized through this single helper so
+        callers can iterate elements without defensive checks.
+        """
+        result.setdefault("_embedded", {}).setdefault("elements", [])
+        return result
+
+    async def _cached_get(self, key: str, endpoint: str, ttl: float = 300) -> Dict:
+        """
+        Fetch a collection endpoint through the per-instance TTL cache.
+
+        Lookup tables like statuses and types change on the order of days;
+        serving them from memory removes a full HTTP round-trip from
+        form-rendering workflows that request them before every create.
+
+        Args:
+            key: Cache key for this lookup
+            endpoint: API endpoint to fetch on a miss
+            ttl: Seconds the cached response stays fresh
+
+        Returns:
+            Dict: Cached or freshly fetched collection response
 
-        if status in error_hints:
-            base_msg += f"\n\n{error_hints[status]}"
+        Raises:
+            Exception: When the refresh fails and no stale copy exists
+        """
+        # Entries are stored as compact orjson bytes rather than live
+        # dicts: the snapshot is several times smaller than the parsed
+        # object graph, and decoding on hit hands every caller a private
+        # copy nobody else can mutate.
+        cached = self._meta_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < ttl:
+            return _json_loads(cached[1])
 
-        return base_msg
+        try:
+            result = self._ensure_elements(await self._request("GET", endpoint))
+        except Exception:
+            # Serve the last good payload when the refresh fails; stale
+            # lookup tables beat an error for these slow-changing endpoints.
+            if cached is not None:
+                return _json_loads(cached[1])
+            raise
+        self._meta_cache[key] = (now, _json_dumps(result))
+        return result
 
     async def test_connection(self) -> Dict:
         """Test the API connection and authentication"""
@@ -160,20 +456,11 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing projects
         """
-        endpoint = "/projects"
-        if filters:
-            encoded_filters = quote(filters)
-            endpoint += f"?filters={encoded_filters}"
-
-        result = await self._request("GET", endpoint)
-
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
+        result = await self._request(
+            "GET", "/projects", params={"filters": filters} if filters else None
+        )
 
-        return result
+        return self._ensure_elements(result)
 
     async def get_work_packages(
         self,
@@ -199,35 +486,137 @@ class OpenProjectClient:
         else:
             endpoint = "/work_packages"
 
-        # Build query parameters
-        query_params = []
-        if filters:
-            encoded_filters = quote(filters)
-            query_params.append(f"filters={encoded_filters}")
-        if offset is not None:
-            query_params.append(f"offset={offset}")
-        if page_size is not None:
-            query_params.append(f"pageSize={page_size}")
+        # Query parameters are escaped by yarl inside _request
+        params = {
+            k: str(v)
+            for k, v in (
+                ("filters", filters),
+                ("offset", offset),
+                ("pageSize", page_size),
+            )
+            if v is not None
+        }
 
-        if query_params:
-            endpoint += "?" + "&".join(query_params)
+        result = await self._request("GET", endpoint, params=params or None)
 
-        result = await self._request("GET", endpoint)
+        return self._ensure_elements(result)
+
+    async def get_all_work_packages(
+        self,
+        project_id: Optional[int] = None,
+        filters: Optional[str] = None,
+        page_size: int = 100,
+    ) -> List[Dict]:
+        """
+        Retrieve every page of a work package listing concurrently.
 
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
+        The first page reveals the total; the remaining page fetches are
+        independent, so they go out in one asyncio.gather burst (bounded
+        by the request semaphore) instead of N serial round-trips.
 
-        return result
+        Args:
+            project_id: Optional project ID to filter by
+            filters: Optional JSON-encoded filter string
+            page_size: Number of results per page
+
+        Returns:
+            List[Dict]: All work package elements, in page order
+        """
+        first = await self.get_work_packages(
+            project_id, filters, offset=1, page_size=page_size
+        )
+        elements = list(first["_embedded"]["elements"])
+
+        total = first.get("total", len(elements))
+        pages = (total + page_size - 1) // page_size
+        if pages > 1:
+            remaining = await asyncio.gather(
+                *(
+                    self.get_work_packages(
+                        project_id, filters, offset=page, page_size=page_size
+                    )
+                    for page in range(2, pages + 1)
+                )
+            )
+            for result in remaining:
+                elements.extend(result["_embedded"]["elements"])
+
+        return elements
+
+    async def iter_work_packages(
+        self,
+        project_id: Optional[int] = None,
+        filters: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ):
+        """
+        Yield work packages one at a time, stream-parsing the response.
+
+        For bulk exports this avoids materializing the full JSON body plus
+        its object graph in memory at once. Streaming parses slower than
+        orjson on small responses, so this is an explicit opt-in for large
+        scans; use get_work_packages for normal page-sized reads. Requires
+        the optional ijson package — without it, this falls back to a
+        materialized fetch and yields from it.
 
-    async def create_work_package(self, data: Dict) -> Dict:
+        Args:
+            project_id: Optional project ID to filter by
+            filters: Optional JSON-encoded filter string
+            page_size: Optional number of results per page
+
+        Yields:
+            Dict: One work package element at a time
+        """
+        try:
+            import ijson
+        except ImportError:
+            result = await self.get_work_packages(
+                project_id, filters, page_size=page_size
+            )
+            for element in result["_embedded"]["elements"]:
+                yield element
+            return
+
+        if project_id:
+            endpoint = f"/projects/{project_id}/work_packages"
+        else:
+            endpoint = "/work_packages"
+
+        params = {
+            k: str(v)
+            for k, v in (("filters", filters), ("pageSize", page_size))
+            if v is not None
+        }
+
+        url = self._api_root + endpoint
+        session = self._get_session()
+
+        async with self._request_semaphore, session.request(
+            "GET", url, params=params or None, proxy=self.proxy
+        ) as response:
+            if response.status >= 400:
+                body = await response.read()
+                raise Exception(
+                    self._format_error_message(
+                        response.status, body.decode(errors="replace")
+                    )
+                )
+            async for element in ijson.items(
+                response.content, "_embedded.elements.item"
+            ):
+                yield element
+
+    async def create_work_package(self, data: Dict, skip_form: bool = False) -> Dict:
         """
         Create a new work package.
 
         Args:
             data: Work package data including project, subject, type, etc.
+            skip_form: Skip the /work_packages/form round-trip and POST the
+                       payload directly. The form call is only needed for
+                       server-side defaults; bulk imports that supply
+                       project, type and subject themselves save one RTT
+                       per created work package.
 
         Returns:
             Dict: Created work package data
@@ -237,44 +626,40 @@ class OpenProjectClient:
 
         # Set required links
         if "project" in data:
-            form_payload["_links"]["project"] = {
-                "href": f"/api/v3/projects/{data['project']}"
-            }
+            form_payload["_links"]["project"] = _project_href(data["project"])
         if "type" in data:
-            form_payload["_links"]["type"] = {"href": f"/api/v3/types/{data['type']}"}
+            form_payload["_links"]["type"] = _type_href(data["type"])
 
         # Set subject if provided
         if "subject" in data:
             form_payload["subject"] = data["subject"]
 
-        # Get form with initial payload
-        form = await self._request("POST", "/work_packages/form", form_payload)
+        if skip_form:
+            payload = form_payload
+            payload["lockVersion"] = 0
+        else:
+            # Get form with initial payload
+            form = await self._request("POST", "/work_packages/form", form_payload)
 
-        # Use form payload and add additional fields
-        payload = form.get("payload", form_payload)
-        payload["lockVersion"] = form.get("lockVersion", 0)
+            # Use form payload and add additional fields
+            payload = form.get("payload", form_payload)
+            payload["lockVersion"] = form.get("lockVersion", 0)
 
         # Add optional fields
         if "description" in data:
             payload["description"] = {"raw": data["description"]}
         if "priority_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["priority"] = {
-                "href": f"/api/v3/priorities/{data['priority_id']}"
-            }
+            payload.setdefault("_links", {})["priority"] = _priority_href(
+                data["priority_id"]
+            )
         if "assignee_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["assignee"] = {
-                "href": f"/api/v3/users/{data['assignee_id']}"
-            }
+            payload.setdefault("_links", {})["assignee"] = _user_href(
+                data["assignee_id"]
+            )
         if "version_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["version"] = {
-                "href": f"/api/v3/versions/{data['version_id']}"
-            }
+            payload.setdefault("_links", {})["version"] = _version_href(
+                data["version_id"]
+            )
 
         # Add date fields (ISO 8601 format: YYYY-MM-DD)
         if "startDate" in data:
@@ -302,15 +687,7 @@ class OpenProjectClient:
         else:
             endpoint = "/types"
 
-        result = await self._request("GET", endpoint)
-
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
-
-        return result
+        return await self._cached_get(f"types:{project_id}", endpoint)
 
     async def get_users(self, filters: Optional[str] = None) -> Dict:
         """
@@ -322,20 +699,11 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing users
         """
-        endpoint = "/users"
-        if filters:
-            encoded_filters = quote(filters)
-            endpoint += f"?filters={encoded_filters}"
-
-        result = await self._request("GET", endpoint)
+        result = await self._request(
+            "GET", "/users", params={"filters": filters} if filters else None
+        )
 
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
-
-        return result
+        return self._ensure_elements(result)
 
     async def get_user(self, user_id: int) -> Dict:
         """
@@ -371,19 +739,57 @@ class OpenProjectClient:
         if user_id:
             filters.append({"user": {"operator": "=", "values": [str(user_id)]}})
 
-        if filters:
-            filter_string = quote(json.dumps(filters))
-            endpoint += f"?filters={filter_string}"
+        result = await self._request(
+            "GET",
+            endpoint,
+            params={"filters": _json_dumps(filters).decode()} if filters else None,
+        )
+
+        return self._ensure_elements(result)
 
-        result = await self._request("GET", endpoint)
+    async def get_memberships_bulk(
+        self, user_ids: List[int], page_size: int = 1000
+    ) -> Dict[int, List[Dict]]:
+        """
+        Retrieve memberships for several users with one request.
 
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
+        Looking up project memberships per user used to mean one request
+        each (the classic N+1 pattern); the filter grammar accepts
+        multiple values, so a single multi-value principal filter fetches
+        everything and the elements are grouped by user id client-side.
 
-        return result
+        Args:
+            user_ids: Principal (user) IDs
+            page_size: Number of results per page
+
+        Returns:
+            Dict[int, List[Dict]]: Membership elements keyed by user ID
+                                   (every requested user gets a key)
+        """
+        filters = _json_dumps(
+            [{"principal": {"operator": "=", "values": [str(u) for u in user_ids]}}]
+        ).decode()
+
+        result = await self._request(
+            "GET",
+            "/memberships",
+            params={"filters": filters, "pageSize": str(page_size)},
+        )
+
+        memberships: Dict[int, List[Dict]] = {int(u): [] for u in user_ids}
+        for element in self._ensure_elements(result)["_embedded"]["elements"]:
+            principal_href = (
+                element.get("_links", {}).get("principal") or {}
+            ).get("href")
+            if not principal_href:
+                continue
+            try:
+                principal_id = int(principal_href.rsplit("/", 1)[-1])
+            except ValueError:
+                continue
+            memberships.setdefault(principal_id, []).append(element)
+
+        return memberships
 
     async def get_statuses(self) -> Dict:
         """
@@ -392,15 +798,7 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing statuses
         """
-        result = await self._request("GET", "/statuses")
-
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
-
-        return result
+        return await self._cached_get("statuses", "/statuses")
 
     async def get_priorities(self) -> Dict:
         """
@@ -409,44 +807,114 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing priorities
         """
-        result = await self._request("GET", "/priorities")
-
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
+        return await self._cached_get("priorities", "/priorities")
+
+    def _get_work_package_loader(self) -> AsyncBatchLoader:
+        """Return the loader that batches concurrent work package fetches."""
+        if self._work_package_loader is None:
+
+            async def fetch_many(ids: List[int]) -> Dict[int, Dict]:
+                filters = _json_dumps(
+                    [{"id": {"operator": "=", "values": [str(i) for i in ids]}}]
+                ).decode()
+                result = await self._request(
+                    "GET",
+                    "/work_packages",
+                    params={"filters": filters, "pageSize": str(len(ids))},
+                )
+                return {
+                    element["id"]: element
+                    for element in self._ensure_elements(result)["_embedded"][
+                        "elements"
+                    ]
+                    if "id" in element
+                }
 
-        return result
+            self._work_package_loader = AsyncBatchLoader(fetch_many)
+        return self._work_package_loader
 
-    async def get_work_package(self, work_package_id: int) -> Dict:
+    async def get_work_package(
+        self, work_package_id: int, coalesce: bool = False
+    ) -> Dict:
         """
         Retrieve a specific work package by ID.
 
         Args:
             work_package_id: The work package ID
+            coalesce: Batch this fetch with other concurrent lookups via
+                      the shared loader (one filter query per ~5 ms window
+                      instead of one request per id). Opt-in because the
+                      batched listing may embed slightly less detail than
+                      the single-resource endpoint.
 
         Returns:
             Dict: Work package data
         """
+        if coalesce:
+            result = await self._get_work_package_loader().load(work_package_id)
+            if result is not None:
+                return result
         return await self._request("GET", f"/work_packages/{work_package_id}")
 
-    async def update_work_package(self, work_package_id: int, data: Dict) -> Dict:
+    async def get_work_packages_bulk(self, ids: List[int]) -> List[Dict]:
+        """
+        Retrieve several work packages concurrently.
+
+        The fetches are independent, so they fan out over the shared
+        connection pool instead of paying one round-trip each in sequence.
+
+        Args:
+            ids: Work package IDs to fetch
+
+        Returns:
+            List[Dict]: Work package data, in the same order as ids
+        """
+        return list(
+            await asyncio.gather(*(self.get_work_package(i) for i in ids))
+        )
+
+    async def get_metadata_bundle(self) -> Dict[str, Dict]:
+        """
+        Retrieve statuses, priorities, types and time entry activities in
+        one concurrent round-trip.
+
+        Returns:
+            Dict: Mapping with keys "statuses", "priorities", "types",
+                  "time_entry_activities"
+        """
+        statuses, priorities, types_, activities = await asyncio.gather(
+            self.get_statuses(),
+            self.get_priorities(),
+            self.get_types(),
+            self.get_time_entry_activities(),
+        )
+        return {
+            "statuses": statuses,
+            "priorities": priorities,
+            "types": types_,
+            "time_entry_activities": activities,
+        }
+
+    async def update_work_package(
+        self,
+        work_package_id: int,
+        data: Dict,
+        lock_version: Optional[int] = None,
+    ) -> Dict:
         """
         Update an existing work package.
 
         Args:
             work_package_id: The work package ID
             data: Update data including fields to modify
+            lock_version: Optional known lockVersion; when omitted the
+                          update is sent optimistically and retried once
+                          on conflict instead of pre-fetching
 
         Returns:
             Dict: Updated work package data
         """
-        # First get current work package to get lock version
-        current_wp = await self.get_work_package(work_package_id)
-
-        # Prepare payload with lock version
-        payload = {"lockVersion": current_wp.get("lockVersion", 0)}
+        payload = {}
 
         # Add fields to update
         if "subject" in data:
@@ -454,46 +922,33 @@ class OpenProjectClient:
         if "description" in data:
             payload["description"] = {"raw": data["description"]}
         if "type_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["type"] = {"href": f"/api/v3/types/{data['type_id']}"}
+            payload.setdefault("_links", {})["type"] = _type_href(data["type_id"])
         if "status_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["status"] = {
-                "href": f"/api/v3/statuses/{data['status_id']}"
-            }
+            payload.setdefault("_links", {})["status"] = _status_href(
+                data["status_id"]
+            )
         if "priority_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["priority"] = {
-                "href": f"/api/v3/priorities/{data['priority_id']}"
-            }
+            payload.setdefault("_links", {})["priority"] = _priority_href(
+                data["priority_id"]
+            )
         if "assignee_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["assignee"] = {
-                "href": f"/api/v3/users/{data['assignee_id']}"
-            }
+            payload.setdefault("_links", {})["assignee"] = _user_href(
+                data["assignee_id"]
+            )
         if "version_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["version"] = {
-                "href": f"/api/v3/versions/{data['version_id']}"
-            }
+            payload.setdefault("_links", {})["version"] = _version_href(
+                data["version_id"]
+            )
         if "percentage_done" in data:
             payload["percentageDone"] = data["percentage_done"]
         if "parent_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
+            links = payload.setdefault("_links", {})
             if data["parent_id"] is None:
-                # Remove parent
-                payload["_links"]["parent"] = {"href": None}
+                # Remove parent (deliberately not cached: href is None)
+                links["parent"] = {"href": None}
             else:
                 # Set parent
-                payload["_links"]["parent"] = {
-                    "href": f"/api/v3/work_packages/{data['parent_id']}"
-                }
+                links["parent"] = _work_package_href(data["parent_id"])
 
         # Add date fields (ISO 8601 format: YYYY-MM-DD)
         if "startDate" in data:
@@ -503,8 +958,11 @@ class OpenProjectClient:
         if "date" in data:
             payload["date"] = data["date"]
 
-        return await self._request(
-            "PATCH", f"/work_packages/{work_package_id}", payload
+        return await self._patch_with_lock(
+            f"/work_packages/{work_package_id}",
+            payload,
+            lambda: self.get_work_package(work_package_id),
+            lock_version,
         )
 
     async def delete_work_package(self, work_package_id: int) -> bool:
@@ -517,8 +975,9 @@ class OpenProjectClient:
         Returns:
             bool: True if successful
         """
-        await self._request("DELETE", f"/work_packages/{work_package_id}")
-        return True
+        return await self._request_no_body(
+            "DELETE", f"/work_packages/{work_package_id}"
+        )
 
     async def add_work_package_comment(
         self,
@@ -571,13 +1030,7 @@ class OpenProjectClient:
             "GET", f"/work_packages/{work_package_id}/activities"
         )
 
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
-
-        return result
+        return self._ensure_elements(result)
 
     async def get_time_entries(self, filters: Optional[str] = None) -> Dict:
         """
@@ -589,20 +1042,13 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing time entries
         """
-        endpoint = "/time_entries"
-        if filters:
-            encoded_filters = quote(filters)
-            endpoint += f"?filters={encoded_filters}"
-
-        result = await self._request("GET", endpoint)
-
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
+        result = await self._request(
+            "GET",
+            "/time_entries",
+            params={"filters": filters} if filters else None,
+        )
 
-        return result
+        return self._ensure_elements(result)
 
     async def create_time_entry(self, data: Dict) -> Dict:
         """
@@ -620,9 +1066,7 @@ class OpenProjectClient:
         # Set required fields
         if "work_package_id" in data:
             payload["_links"] = {
-                "workPackage": {
-                    "href": f"/api/v3/work_packages/{data['work_package_id']}"
-                }
+                "workPackage": _work_package_href(data["work_package_id"])
             }
         if "hours" in data:
             payload["hours"] = f"PT{data['hours']}H"
@@ -631,30 +1075,31 @@ class OpenProjectClient:
         if "comment" in data:
             payload["comment"] = {"raw": data["comment"]}
         if "activity_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["activity"] = {
-                "href": f"/api/v3/time_entries/activities/{data['activity_id']}"
-            }
+            payload.setdefault("_links", {})["activity"] = _activity_href(
+                data["activity_id"]
+            )
 
         return await self._request("POST", "/time_entries", payload)
 
-    async def update_time_entry(self, time_entry_id: int, data: Dict) -> Dict:
+    async def update_time_entry(
+        self,
+        time_entry_id: int,
+        data: Dict,
+        lock_version: Optional[int] = None,
+    ) -> Dict:
         """
         Update an existing time entry.
 
         Args:
             time_entry_id: The time entry ID
             data: Update data including fields to modify
+            lock_version: Optional known lockVersion to skip the conflict
+                          retry round-trip
 
         Returns:
             Dict: Updated time entry data
         """
-        # First get current time entry to get lock version
-        current_te = await self._request("GET", f"/time_entries/{time_entry_id}")
-
-        # Prepare payload with lock version
-        payload = {"lockVersion": current_te.get("lockVersion", 0)}
+        payload = {}
 
         # Add fields to update
         if "hours" in data:
@@ -664,13 +1109,16 @@ class OpenProjectClient:
         if "comment" in data:
             payload["comment"] = {"raw": data["comment"]}
         if "activity_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["activity"] = {
-                "href": f"/api/v3/time_entries/activities/{data['activity_id']}"
-            }
+            payload.setdefault("_links", {})["activity"] = _activity_href(
+                data["activity_id"]
+            )
 
-        return await self._request("PATCH", f"/time_entries/{time_entry_id}", payload)
+        return await self._patch_with_lock(
+            f"/time_entries/{time_entry_id}",
+            payload,
+            lambda: self._request("GET", f"/time_entries/{time_entry_id}"),
+            lock_version,
+        )
 
     async def delete_time_entry(self, time_entry_id: int) -> bool:
         """
@@ -682,8 +1130,7 @@ class OpenProjectClient:
         Returns:
             bool: True if successful
         """
-        await self._request("DELETE", f"/time_entries/{time_entry_id}")
-        return True
+        return await self._request_no_body("DELETE", f"/time_entries/{time_entry_id}")
 
     async def get_time_entry_activities(self) -> Dict:
         """
@@ -692,15 +1139,11 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing activities
         """
-        result = await self._request("GET", "/time_entries/activities")
-
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
-
-        return result
+        # Activity definitions change on the order of days; cache them far
+        # longer than the default lookup tables.
+        return await self._cached_get(
+            "time_entry_activities", "/time_entries/activities", ttl=3600
+        )
 
     async def get_versions(self, project_id: Optional[int] = None) -> Dict:
         """
@@ -717,15 +1160,19 @@ class OpenProjectClient:
         else:
             endpoint = "/versions"
 
-        result = await self._request("GET", endpoint)
+        # Versions are medium-churn project metadata; a short TTL absorbs
+        # repeated lookups without hiding edits for long. Writers below
+        # drop the cached copies.
+        return await self._cached_get(f"versions:{project_id}", endpoint, ttl=30)
 
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
+    def _invalidate_versions_cache(self) -> None:
+        """Drop every cached versions listing after a version write.
 
-        return result
+        Update and delete only know the version id, not its project, so
+        all versions keys go rather than guessing which listing changed.
+        """
+        for key in [k for k in self._meta_cache if k.startswith("versions:")]:
+            del self._meta_cache[key]
 
     async def create_version(self, project_id: int, data: Dict) -> Dict:
         """
@@ -739,9 +1186,7 @@ class OpenProjectClient:
             Dict: Created version data
         """
         # Prepare payload
-        payload = {
-            "_links": {"definingProject": {"href": f"/api/v3/projects/{project_id}"}}
-        }
+        payload = {"_links": {"definingProject": _project_href(project_id)}}
 
         # Set required fields
         if "name" in data:
@@ -755,7 +1200,9 @@ class OpenProjectClient:
         if "status" in data:
             payload["status"] = data["status"]
 
-        return await self._request("POST", "/versions", payload)
+        result = await self._request("POST", "/versions", payload)
+        self._invalidate_versions_cache()
+        return result
 
     async def get_version(self, version_id: int) -> Dict:
         """
@@ -769,26 +1216,21 @@ class OpenProjectClient:
         """
         return await self._request("GET", f"/versions/{version_id}")
 
-    async def update_version(self, version_id: int, data: Dict) -> Dict:
+    async def update_version(
+        self, version_id: int, data: Dict, lock_version: Optional[int] = None
+    ) -> Dict:
         """
         Update an existing version.
 
         Args:
             version_id: The version ID
             data: Update data including fields to modify
+            lock_version: Optional known lockVersion to skip the pre-fetch
 
         Returns:
             Dict: Updated version data
         """
-        # First get current version to get lock version
-        try:
-            current_version = await self.get_version(version_id)
-            lock_version = current_version.get("lockVersion", 0)
-        except:
-            lock_version = 0
-
-        # Prepare payload with lock version
-        payload = {"lockVersion": lock_version}
+        payload = {}
 
         # Add fields to update
         if "name" in data:
@@ -802,7 +1244,14 @@ class OpenProjectClient:
         if "status" in data:
             payload["status"] = data["status"]
 
-        return await self._request("PATCH", f"/versions/{version_id}", payload)
+        result = await self._patch_with_lock(
+            f"/versions/{version_id}",
+            payload,
+            lambda: self.get_version(version_id),
+            lock_version,
+        )
+        self._invalidate_versions_cache()
+        return result
 
     async def delete_version(self, version_id: int) -> bool:
         """
@@ -814,24 +1263,37 @@ class OpenProjectClient:
         Returns:
             bool: True if successful
         """
-        await self._request("DELETE", f"/versions/{version_id}")
-        return True
+        success = await self._request_no_body("DELETE", f"/versions/{version_id}")
+        self._invalidate_versions_cache()
+        return success
 
 
     async def check_permissions(self) -> Dict:
         """
         Check user permissions and capabilities.
 
+        Many tools run this check per invocation; the current-user answer
+        is served from a short 30s cache so repeated checks within a
+        session cost no round-trip.
+
         Returns:
             Dict: User information including permissions
         """
+        cached = self._meta_cache.get("permissions")
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < 30:
+            return _json_loads(cached[1])
+
         try:
             # Get current user info which includes permissions
-            return await self._request("GET", "/users/me")
+            result = await self._request("GET", "/users/me")
         except Exception as e:
             logger.error(f"Failed to check permissions: {e}")
             return {}
 
+        self._meta_cache["permissions"] = (now, _json_dumps(result))
+        return result
+
     async def create_project(self, data: Dict) -> Dict:
         """
         Create a new project.
@@ -857,34 +1319,28 @@ class OpenProjectClient:
         if "status" in data:
             payload["status"] = data["status"]
         if "parent_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["parent"] = {
-                "href": f"/api/v3/projects/{data['parent_id']}"
-            }
+            payload.setdefault("_links", {})["parent"] = _project_href(
+                data["parent_id"]
+            )
 
         return await self._request("POST", "/projects", payload)
 
-    async def update_project(self, project_id: int, data: Dict) -> Dict:
+    async def update_project(
+        self, project_id: int, data: Dict, lock_version: Optional[int] = None
+    ) -> Dict:
         """
         Update an existing project.
 
         Args:
             project_id: The project ID
             data: Update data including fields to modify
+            lock_version: Optional known lockVersion to skip the conflict
+                          retry round-trip
 
         Returns:
             Dict: Updated project data
         """
-        # First get current project to get lock version if needed
-        try:
-            current_project = await self.get_project(project_id)
-            lock_version = current_project.get("lockVersion", 0)
-        except:
-            lock_version = 0
-
-        # Prepare payload with lock version
-        payload = {"lockVersion": lock_version}
+        payload = {}
 
         # Add fields to update
         if "name" in data:
@@ -898,13 +1354,16 @@ class OpenProjectClient:
         if "status" in data:
             payload["status"] = data["status"]
         if "parent_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["parent"] = {
-                "href": f"/api/v3/projects/{data['parent_id']}"
-            }
+            payload.setdefault("_links", {})["parent"] = _project_href(
+                data["parent_id"]
+            )
 
-        return await self._request("PATCH", f"/projects/{project_id}", payload)
+        return await self._patch_with_lock(
+            f"/projects/{project_id}",
+            payload,
+            lambda: self.get_project(project_id),
+            lock_version,
+        )
 
     async def delete_project(self, project_id: int) -> bool:
         """
@@ -916,8 +1375,7 @@ class OpenProjectClient:
         Returns:
             bool: True if successful
         """
-        await self._request("DELETE", f"/projects/{project_id}")
-        return True
+        return await self._request_no_body("DELETE", f"/projects/{project_id}")
 
     async def get_project(self, project_id: int) -> Dict:
         """
@@ -975,15 +1433,7 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing roles
         """
-        result = await self._request("GET", "/roles")
-
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
-
-        return result
+        return await self._cached_get("roles", "/roles")
 
     async def get_role(self, role_id: int) -> Dict:
         """
@@ -1012,64 +1462,55 @@ class OpenProjectClient:
 
         # Set required fields
         if "project_id" in data:
-            payload["_links"]["project"] = {
-                "href": f"/api/v3/projects/{data['project_id']}"
-            }
+            payload["_links"]["project"] = _project_href(data["project_id"])
         if "user_id" in data:
-            payload["_links"]["principal"] = {
-                "href": f"/api/v3/users/{data['user_id']}"
-            }
+            payload["_links"]["principal"] = _user_href(data["user_id"])
         elif "group_id" in data:
-            payload["_links"]["principal"] = {
-                "href": f"/api/v3/groups/{data['group_id']}"
-            }
+            payload["_links"]["principal"] = _group_href(data["group_id"])
         if "role_ids" in data:
             payload["_links"]["roles"] = [
-                {"href": f"/api/v3/roles/{role_id}"} for role_id in data["role_ids"]
+                _role_href(role_id) for role_id in data["role_ids"]
             ]
         elif "role_id" in data:
-            payload["_links"]["roles"] = [{"href": f"/api/v3/roles/{data['role_id']}"}]
+            payload["_links"]["roles"] = [_role_href(data["role_id"])]
         if "notification_message" in data:
             payload["notificationMessage"] = {"raw": data["notification_message"]}
 
         return await self._request("POST", "/memberships", payload)
 
-    async def update_membership(self, membership_id: int, data: Dict) -> Dict:
+    async def update_membership(
+        self, membership_id: int, data: Dict, lock_version: Optional[int] = None
+    ) -> Dict:
         """
         Update an existing membership.
 
         Args:
             membership_id: The membership ID
             data: Update data including fields to modify
+            lock_version: Optional known lockVersion to skip the conflict
+                          retry round-trip
 
         Returns:
             Dict: Updated membership data
         """
-        # First get current membership to get lock version if needed
-        try:
-            current_membership = await self.get_membership(membership_id)
-            lock_version = current_membership.get("lockVersion", 0)
-        except:
-            lock_version = 0
-
-        # Prepare payload with lock version
-        payload = {"lockVersion": lock_version}
+        payload = {}
 
         # Add fields to update
         if "role_ids" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["roles"] = [
-                {"href": f"/api/v3/roles/{role_id}"} for role_id in data["role_ids"]
+            payload.setdefault("_links", {})["roles"] = [
+                _role_href(role_id) for role_id in data["role_ids"]
             ]
         elif "role_id" in data:
-            if "_links" not in payload:
-                payload["_links"] = {}
-            payload["_links"]["roles"] = [{"href": f"/api/v3/roles/{data['role_id']}"}]
+            payload.setdefault("_links", {})["roles"] = [_role_href(data["role_id"])]
         if "notification_message" in data:
             payload["notificationMessage"] = {"raw": data["notification_message"]}
 
-        return await self._request("PATCH", f"/memberships/{membership_id}", payload)
+        return await self._patch_with_lock(
+            f"/memberships/{membership_id}",
+            payload,
+            lambda: self.get_membership(membership_id),
+            lock_version,
+        )
 
     async def delete_membership(self, membership_id: int) -> bool:
         """
@@ -1081,8 +1522,7 @@ class OpenProjectClient:
         Returns:
             bool: True if successful
         """
-        await self._request("DELETE", f"/memberships/{membership_id}")
-        return True
+        return await self._request_no_body("DELETE", f"/memberships/{membership_id}")
 
     async def get_membership(self, membership_id: int) -> Dict:
         """
@@ -1097,7 +1537,10 @@ class OpenProjectClient:
         return await self._request("GET", f"/memberships/{membership_id}")
 
     async def set_work_package_parent(
-        self, work_package_id: int, parent_id: int
+        self,
+        work_package_id: int,
+        parent_id: int,
+        lock_version: Optional[int] = None,
     ) -> Dict:
         """
         Set a parent for a work package (create parent-child relationship).
@@ -1105,49 +1548,44 @@ class OpenProjectClient:
         Args:
             work_package_id: The work package ID to become a child
             parent_id: The work package ID to become the parent
+            lock_version: Optional known lockVersion to skip the conflict
+                          retry round-trip
 
         Returns:
             Dict: Updated work package data
         """
-        # First get current work package to get lock version
-        try:
-            current_wp = await self.get_work_package(work_package_id)
-            lock_version = current_wp.get("lockVersion", 0)
-        except:
-            lock_version = 0
-
         # Prepare payload with parent link
-        payload = {
-            "lockVersion": lock_version,
-            "_links": {"parent": {"href": f"/api/v3/work_packages/{parent_id}"}},
-        }
+        payload = {"_links": {"parent": _work_package_href(parent_id)}}
 
-        return await self._request(
-            "PATCH", f"/work_packages/{work_package_id}", payload
+        return await self._patch_with_lock(
+            f"/work_packages/{work_package_id}",
+            payload,
+            lambda: self.get_work_package(work_package_id),
+            lock_version,
         )
 
-    async def remove_work_package_parent(self, work_package_id: int) -> Dict:
+    async def remove_work_package_parent(
+        self, work_package_id: int, lock_version: Optional[int] = None
+    ) -> Dict:
         """
         Remove parent relationship from a work package (make it top-level).
 
         Args:
             work_package_id: The work package ID to remove parent from
+            lock_version: Optional known lockVersion to skip the conflict
+                          retry round-trip
 
         Returns:
             Dict: Updated work package data
         """
-        # First get current work package to get lock version
-        try:
-            current_wp = await self.get_work_package(work_package_id)
-            lock_version = current_wp.get("lockVersion", 0)
-        except:
-            lock_version = 0
-
         # Prepare payload with null parent link
-        payload = {"lockVersion": lock_version, "_links": {"parent": None}}
+        payload = {"_links": {"parent": None}}
 
-        return await self._request(
-            "PATCH", f"/work_packages/{work_package_id}", payload
+        return await self._patch_with_lock(
+            f"/work_packages/{work_package_id}",
+            payload,
+            lambda: self.get_work_package(work_package_id),
+            lock_version,
         )
 
     async def list_work_package_children(
@@ -1169,34 +1607,108 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing child work packages
         """
-        if include_descendants:
-            # Use descendants filter to get all levels
-            filters = json.dumps(
-                [{"descendantsOf": {"operator": "=", "values": [str(parent_id)]}}]
-            )
-        else:
-            # Use parent filter to get direct children only
-            filters = json.dumps(
-                [{"parent": {"operator": "=", "values": [str(parent_id)]}}]
-            )
-
-        # Build query parameters
-        query_params = [f"filters={quote(filters)}"]
+        # descendantsOf covers all levels; parent only direct children
+        params = {
+            "filters": _parent_filter_json(parent_id, include_descendants),
+            "select": _WP_LIST_SELECT,
+        }
         if offset is not None:
-            query_params.append(f"offset={offset}")
+            params["offset"] = str(offset)
         if page_size is not None:
-            query_params.append(f"pageSize={page_size}")
+            params["pageSize"] = str(page_size)
 
-        endpoint = f"/work_packages?" + "&".join(query_params)
-        result = await self._request("GET", endpoint)
+        result = await self._request("GET", "/work_packages", params=params)
 
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
+        return self._ensure_elements(result)
 
-        return result
+    async def iter_work_package_children(
+        self,
+        parent_id: int,
+        include_descendants: bool = False,
+        page_size: int = 200,
+    ):
+        """
+        Stream child work packages one element at a time.
+
+        Deep subtrees can hold thousands of descendants; materializing
+        them in one dict holds the whole tree in memory at once. This
+        generator fetches one page at a time and yields elements as they
+        arrive, keeping memory O(page_size) and getting the first result
+        to the caller after a single round-trip.
+
+        Args:
+            parent_id: The parent work package ID
+            include_descendants: If True, includes grandchildren and below
+            page_size: Number of results fetched per round-trip
+
+        Yields:
+            Dict: One child work package per iteration
+        """
+        filters = _parent_filter_json(parent_id, include_descendants)
+        page = 1
+        while True:
+            result = await self._request(
+                "GET",
+                "/work_packages",
+                params={
+                    "filters": filters,
+                    "select": _WP_LIST_SELECT,
+                    "offset": str(page),
+                    "pageSize": str(page_size),
+                },
+            )
+            elements = self._ensure_elements(result)["_embedded"]["elements"]
+            for element in elements:
+                yield element
+            if len(elements) < page_size:
+                return
+            page += 1
+
+    async def list_work_package_children_bulk(
+        self, parent_ids: List[int], page_size: int = 1000
+    ) -> Dict[int, List[Dict]]:
+        """
+        List direct children for several parents with one request.
+
+        Listing a hierarchy level used to mean one request per parent (the
+        classic N+1 pattern); the filter grammar accepts multiple values,
+        so a single multi-value parent filter fetches everything and the
+        elements are grouped by parent id client-side.
+
+        Args:
+            parent_ids: Parent work package IDs
+            page_size: Number of results per page
+
+        Returns:
+            Dict[int, List[Dict]]: Child work packages keyed by parent ID
+                                   (every requested parent gets a key)
+        """
+        filters = _json_dumps(
+            [{"parent": {"operator": "=", "values": [str(p) for p in parent_ids]}}]
+        ).decode()
+
+        result = await self._request(
+            "GET",
+            "/work_packages",
+            params={
+                "filters": filters,
+                "pageSize": str(page_size),
+                "select": _WP_LIST_SELECT,
+            },
+        )
+
+        children: Dict[int, List[Dict]] = {int(p): [] for p in parent_ids}
+        for element in self._ensure_elements(result)["_embedded"]["elements"]:
+            parent_href = (element.get("_links", {}).get("parent") or {}).get("href")
+            if not parent_href:
+                continue
+            try:
+                parent_id = int(parent_href.rsplit("/", 1)[-1])
+            except ValueError:
+                continue
+            children.setdefault(parent_id, []).append(element)
+
+        return children
 
     # Alias for backward compatibility and consistency with tool naming
     async def get_work_package_children(
@@ -1230,9 +1742,7 @@ class OpenProjectClient:
 
         # Set required fields
         if "to_id" in data:
-            payload["_links"]["to"] = {
-                "href": f"/api/v3/work_packages/{data['to_id']}"
-            }
+            payload["_links"]["to"] = _work_package_href(data["to_id"])
         if "type" in data:
             payload["type"] = data["type"]
         if "lag" in data:
@@ -1255,41 +1765,28 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing relations
         """
-        endpoint = "/relations"
-        if filters:
-            encoded_filters = quote(filters)
-            endpoint += f"?filters={encoded_filters}"
-
-        result = await self._request("GET", endpoint)
-
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
+        result = await self._request(
+            "GET", "/relations", params={"filters": filters} if filters else None
+        )
 
-        return result
+        return self._ensure_elements(result)
 
-    async def update_work_package_relation(self, relation_id: int, data: Dict) -> Dict:
+    async def update_work_package_relation(
+        self, relation_id: int, data: Dict, lock_version: Optional[int] = None
+    ) -> Dict:
         """
         Update an existing work package relation.
 
         Args:
             relation_id: The relation ID
             data: Update data including fields to modify
+            lock_version: Optional known lockVersion to skip the conflict
+                          retry round-trip
 
         Returns:
             Dict: Updated relation data
         """
-        # First get current relation to get lock version if needed
-        try:
-            current_relation = await self.get_work_package_relation(relation_id)
-            lock_version = current_relation.get("lockVersion", 0)
-        except:
-            lock_version = 0
-
-        # Prepare payload with lock version
-        payload = {"lockVersion": lock_version}
+        payload = {}
 
         # Add fields to update
         if "relation_type" in data:
@@ -1299,7 +1796,12 @@ class OpenProjectClient:
         if "description" in data:
             payload["description"] = data["description"]
 
-        return await self._request("PATCH", f"/relations/{relation_id}", payload)
+        return await self._patch_with_lock(
+            f"/relations/{relation_id}",
+            payload,
+            lambda: self.get_work_package_relation(relation_id),
+            lock_version,
+        )
 
     async def delete_work_package_relation(self, relation_id: int) -> bool:
         """
@@ -1311,8 +1813,7 @@ class OpenProjectClient:
         Returns:
             bool: True if successful
         """
-        await self._request("DELETE", f"/relations/{relation_id}")
-        return True
+        return await self._request_no_body("DELETE", f"/relations/{relation_id}")
 
     async def get_work_package_relation(self, relation_id: int) -> Dict:
         """
@@ -1349,33 +1850,21 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing news entries
         """
-        endpoint = "/news"
-
-        # Build query parameters
-        query_params = []
-        if filters:
-            encoded_filters = quote(filters)
-            query_params.append(f"filters={encoded_filters}")
-        if sort_by:
-            encoded_sort = quote(sort_by)
-            query_params.append(f"sortBy={encoded_sort}")
-        if offset is not None:
-            query_params.append(f"offset={offset}")
-        if page_size is not None:
-            query_params.append(f"pageSize={page_size}")
-
-        if query_params:
-            endpoint += "?" + "&".join(query_params)
-
-        result = await self._request("GET", endpoint)
+        # Build query parameters; yarl escapes them inside _request
+        params = {
+            k: str(v)
+            for k, v in (
+                ("filters", filters),
+                ("sortBy", sort_by),
+                ("offset", offset),
+                ("pageSize", page_size),
+            )
+            if v is not None
+        }
 
-        # Ensure proper response structure
-        if "_embedded" not in result:
-            result["_embedded"] = {"elements": []}
-        elif "elements" not in result.get("_embedded", {}):
-            result["_embedded"]["elements"] = []
+        result = await self._request("GET", "/news", params=params or None)
 
-        return result
+        return self._ensure_elements(result)
 
     async def get_news_item(self, news_id: int) -> Dict:
         """
@@ -1416,9 +1905,7 @@ class OpenProjectClient:
 
         # Set project link (required)
         if "project" in data:
-            payload["_links"] = {
-                "project": {"href": f"/api/v3/projects/{data['project']}"}
-            }
+            payload["_links"] = {"project": _project_href(data["project"])}
 
         return await self._request("POST", "/news", payload)
 
@@ -1462,6 +1949,5 @@ class OpenProjectClient:
         Returns:
             bool: True if successful
         """
-        await self._request("DELETE", f"/news/{news_id}")
-        return True
+        return await self._request_no_body("DELETE", f"/news/{news_id}")
 
@@ -0,0 +1,89 @@
+"""
+DataLoader-style request coalescing for OpenProject entity lookups.
+
+Concurrent tool calls frequently fetch the same or sibling entities within
+milliseconds of each other. A loader collects the ids requested inside a
+short wait window and resolves them with one batched filter query instead
+of one HTTP round-trip per id.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class AsyncBatchLoader:
+    """Coalesce concurrent per-id lookups into batched fetches.
+
+    Callers await load(key); keys seen within the wait window (or until the
+    batch is full) are fetched together via fetch_many, and every waiting
+    future resolves from the shared result. Duplicate keys in one window
+    share a single future, deduplicating identical in-flight requests.
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[List[Any]], Awaitable[Dict[Any, Any]]],
+        max_batch: int = 50,
+        max_wait_ms: float = 5,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            fetch_many: Coroutine function taking a list of keys and
+                        returning a dict mapping each key to its result
+            max_batch: Flush immediately once this many keys are pending
+            max_wait_ms: Upper bound on how long a key waits to be batched
+        """
+        self._fetch_many = fetch_many
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._pending: Dict[Any, asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def load(self, key: Any) -> Any:
+        """Fetch one entity, coalescing with concurrent loads.
+
+        Args:
+            key: Entity id to fetch
+
+        Returns:
+            The value fetch_many produced for this key (None if absent)
+        """
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch:
+                self._dispatch()
+            elif self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_after_wait())
+        return await future
+
+    async def _flush_after_wait(self) -> None:
+        """Dispatch whatever has accumulated once the wait window closes."""
+        await asyncio.sleep(self._max_wait)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Move the pending keys into a batch task and reset the window."""
+        pending, self._pending = self._pending, {}
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        if pending:
+            asyncio.create_task(self._run_batch(pending))
+
+    async def _run_batch(self, pending: Dict[Any, asyncio.Future]) -> None:
+        """Execute one batched fetch and resolve the waiting futures."""
+        try:
+            results = await self._fetch_many(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(results.get(key))
@@ -4,6 +4,10 @@ OpenProject MCP Server - FastMCP Implementation
 Main server file that initializes FastMCP and registers all tools.
 """
 
+import asyncio
+import atexit
+import functools
+import importlib
 import os
 import logging
 from dotenv import load_dotenv
@@ -26,10 +30,13 @@ mcp = FastMCP(
     name="openproject-mcp"
 )
 
-# Initialize OpenProject client as global variable
-_client = None
-
-try:
+# Initialize OpenProject client as a process-wide singleton. The
+# lru_cache guard means any entrypoint that triggers construction again
+# (tests, the HTTP wrapper, a re-imported module) reuses the same client
+# and therefore the same connection pool.
+@functools.lru_cache(maxsize=1)
+def _build_client() -> OpenProjectClient:
+    """Construct the shared OpenProject client from the environment."""
     base_url = os.getenv("OPENPROJECT_URL")
     api_key = os.getenv("OPENPROJECT_API_KEY")
     proxy = os.getenv("OPENPROJECT_PROXY")
@@ -39,7 +46,7 @@ try:
             "Missing required environment variables: OPENPROJECT_URL and OPENPROJECT_API_KEY must be set"
         )
 
-    _client = OpenProjectClient(
+    client = OpenProjectClient(
         base_url=base_url,
         api_key=api_key,
         proxy=proxy
@@ -49,6 +56,11 @@ try:
     logger.info(f"   Server: {base_url}")
     logger.info(f"   Proxy: {proxy if proxy else 'None'}")
 
+    return client
+
+
+try:
+    _client = _build_client()
 except Exception as e:
     logger.error(f"❌ Failed to initialize OpenProject client: {e}")
     raise
@@ -60,27 +72,48 @@ def get_client():
     return _client
 
 
-# Import ALL tool modules (decorators auto-register tools)
-logger.info("Loading tool modules...")
+def _close_client():
+    """Close the client's pooled HTTP session on interpreter shutdown."""
+    if _client is None:
+        return
+    try:
+        loop = asyncio.get_event_loop_policy().get_event_loop()
+        if not loop.is_closed():
+            loop.run_until_complete(_client.close())
+    except Exception:
+        # Best-effort cleanup; the OS reclaims the sockets regardless
+        pass
 
-try:
-    # Phase 1: Core Work Package Tools
-    from src.tools import connection      # 2 tools: test_connection, check_permissions
-    from src.tools import work_packages   # 14 tools: list, create, update, delete, list_types, list_statuses, list_priorities, assign, unassign, add_comment, list_activities, get_watchers, add_watcher, get (REMOVED: search)
-    from src.tools import work_packages_bulk  # 2 tools: bulk_add_comment, bulk_update_filtered_work_packages
-    from src.tools import projects        # 8 tools: list, get, create, update, delete, add_subproject, get_subprojects (hierarchy support)
 
+atexit.register(_close_client)
+
+
+# Tool modules registered at startup (decorators auto-register tools).
+# Kept as data so the import loop below stays the single registration
+# point instead of a dozen hand-maintained import statements.
+TOOL_MODULES = (
+    # Phase 1: Core Work Package Tools
+    "connection",         # test_connection, check_permissions
+    "work_packages",      # list, create, update, delete, list_types, list_statuses, list_priorities, assign, unassign, add_comment, list_activities, get_watchers, add_watcher, get
+    "work_packages_bulk", # bulk_add_comment, bulk_update_filtered_work_packages
+    "projects",           # list, get, create, update, delete, add_subproject, get_subprojects
     # Phase 2: Extended Functionality
-    from src.tools import users           # 5 tools: list_users, get_user, list_roles, get_role, list_user_projects (REMOVED: list_project_members duplicate)
-    from src.tools import memberships     # 5 tools: list, get, create, update, delete
-    from src.tools import hierarchy       # 3 tools: set_work_package_parent, remove_work_package_parent, list_work_package_children
-    from src.tools import relations       # 5 tools: create, list, get, update, delete
-    from src.tools import time_entries    # 5 tools: list, create, update, delete, list_activities
-    from src.tools import versions        # 5 tools: list, get, create, update, delete (ADDED: get, update, delete)
-    from src.tools import weekly_reports  # 4 tools: generate_weekly_report, get_report_data, generate_this_week_report, generate_last_week_report
-    from src.tools import news            # 5 tools: list_news, create_news, get_news, update_news, delete_news (KEPT: daily announcements use case)
-
-    logger.info("✅ All 59 tool modules loaded successfully")  # 14+2+8+5+5+3+5+5+5+4+5 = 59 tools
+    "users",              # list_users, get_user, list_roles, get_role, list_user_projects
+    "memberships",        # list, get, create, update, delete
+    "hierarchy",          # set_work_package_parent, remove_work_package_parent, list_work_package_children (+bulk)
+    "relations",          # create (+bulk), list, get, update, delete
+    "time_entries",       # list, create, update, delete, list_activities
+    "versions",           # list, get, create, update, delete
+    "weekly_reports",     # generate_weekly_report, get_report_data, generate_this_week_report, generate_last_week_report
+    "news",               # list_news, create_news, get_news, update_news, delete_news
+)
+
+logger.info("Loading tool modules...")
+
+try:
+    for _name in TOOL_MODULES:
+        importlib.import_module(f"src.tools.{_name}")
+    logger.info("✅ All %d tool modules loaded successfully", len(TOOL_MODULES))
 except ImportError as e:
     logger.warning(f"⚠️  Some tool modules failed to import: {e}")
     raise
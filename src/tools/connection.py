@@ -1,6 +1,25 @@
 """Connection and permission checking tools."""
 
 from src.server import mcp, get_client
+from src.utils.formatting import SafeDict
+
+
+# Static response templates, built once at import time instead of
+# re-assembled on every call.
+_CONN_OK_TMPL = (
+    "✅ API connection successful!\n\n"
+    "**Instance Version**: {instanceVersion}\n"
+    "**Core Version**: {coreVersion}\n"
+)
+
+_PERMS_TMPL = (
+    "✅ User Permissions Retrieved\n\n"
+    "**Name**: {name}\n"
+    "**Email**: {email}\n"
+    "**Login**: {login}\n"
+    "**Status**: {status}\n"
+    "**Admin**: {admin_display}\n"
+)
 
 
 @mcp.tool
@@ -14,11 +33,7 @@ async def test_connection() -> str:
         client = get_client()
         result = await client.test_connection()
 
-        text = "✅ API connection successful!\n\n"
-        text += f"**Instance Version**: {result.get('instanceVersion', 'Unknown')}\n"
-        text += f"**Core Version**: {result.get('coreVersion', 'Unknown')}\n"
-
-        return text
+        return _CONN_OK_TMPL.format_map(SafeDict(result, default="Unknown"))
 
     except Exception as e:
         return f"❌ Connection failed: {str(e)}"
@@ -38,14 +53,11 @@ async def check_permissions() -> str:
         if not result:
             return "❌ Failed to retrieve permissions information"
 
-        text = "✅ User Permissions Retrieved\n\n"
-        text += f"**Name**: {result.get('name', 'Unknown')}\n"
-        text += f"**Email**: {result.get('email', 'N/A')}\n"
-        text += f"**Login**: {result.get('login', 'N/A')}\n"
-        text += f"**Status**: {result.get('status', 'Unknown')}\n"
-        text += f"**Admin**: {'Yes' if result.get('admin') else 'No'}\n"
-
-        return text
+        mapping = SafeDict(result, default="Unknown")
+        mapping.setdefault("email", "N/A")
+        mapping.setdefault("login", "N/A")
+        mapping["admin_display"] = "Yes" if result.get("admin") else "No"
+        return _PERMS_TMPL.format_map(mapping)
 
     except Exception as e:
         return f"❌ Failed to check permissions: {str(e)}"
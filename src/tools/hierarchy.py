@@ -1,6 +1,7 @@
 """Work package hierarchy management tools (parent-child relationships)."""
 
-from typing import Optional
+import json
+from typing import List, Optional
 from src.server import mcp, get_client
 from src.utils.formatting import format_success, format_error, format_work_package_list
 
@@ -90,15 +91,52 @@ async def list_work_package_children(
         if not children:
             return f"Work package #{work_package_id} has no children."
 
-        text = f"✅ **Children of Work Package #{work_package_id}:**\n\n"
-        text += format_work_package_list(children)
+        parts = [
+            f"✅ **Children of Work Package #{work_package_id}:**\n\n",
+            format_work_package_list(children),
+        ]
 
         # Add pagination info
         if total > page_size:
-            text += f"\n📄 **Pagination**: Showing {offset + 1}-{offset + len(children)} of {total} total\n"
-            text += f"   Use `offset={offset + page_size}` to see next page\n"
+            parts.append(
+                f"\n📄 **Pagination**: Showing {offset + 1}-{offset + len(children)} of {total} total\n"
+                f"   Use `offset={offset + page_size}` to see next page\n"
+            )
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return format_error(f"Failed to list children: {str(e)}")
+
+
+@mcp.tool
+async def list_work_package_children_bulk(parent_ids: List[int]) -> str:
+    """List direct children for several parent work packages at once.
+
+    Issues a single filtered query instead of one request per parent, so
+    listing a whole hierarchy level costs one round-trip.
+
+    Args:
+        parent_ids: IDs of the parent work packages
+
+    Returns:
+        Child work packages grouped by parent
+    """
+    try:
+        client = get_client()
+
+        grouped = await client.list_work_package_children_bulk(parent_ids)
+
+        parts = [f"✅ **Children of {len(parent_ids)} work packages:**\n\n"]
+        for parent_id in parent_ids:
+            children = grouped.get(parent_id, [])
+            parts.append(f"**Parent #{parent_id}** ({len(children)} children)\n\n")
+            parts.append(
+                format_work_package_list(children) if children else "No children.\n"
+            )
+            parts.append("\n")
+
+        return "".join(parts)
+
+    except Exception as e:
+        return format_error(f"Failed to list children in bulk: {str(e)}")
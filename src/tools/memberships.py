@@ -1,9 +1,10 @@
 """Membership management tools."""
 
+import asyncio
 from typing import Optional, List
 from pydantic import BaseModel, Field
 from src.server import mcp, get_client
-from src.utils.formatting import format_success, format_error
+from src.utils.formatting import format_success, format_error, EMPTY_MAPPING
 
 
 class CreateMembershipInput(BaseModel):
@@ -27,13 +28,16 @@ class UpdateMembershipInput(BaseModel):
 @mcp.tool
 async def list_memberships(
     project_id: Optional[int] = None,
-    user_id: Optional[int] = None
+    user_id: Optional[int] = None,
+    detailed: bool = False
 ) -> str:
     """List memberships (project members).
 
     Args:
         project_id: Optional project ID to filter by project
         user_id: Optional user ID to filter by user
+        detailed: If True, also fetch each member's email and status
+            (the user lookups run concurrently, at most 10 in flight)
 
     Returns:
         List of memberships with project, user, and role information
@@ -42,12 +46,44 @@ async def list_memberships(
         client = get_client()
 
         result = await client.get_memberships(project_id=project_id, user_id=user_id)
-        memberships = result.get("_embedded", {}).get("elements", [])
+        memberships = (result.get("_embedded") or EMPTY_MAPPING).get("elements", [])
 
         if not memberships:
             return "No memberships found."
 
-        text = f"✅ **Found {len(memberships)} membership(s):**\n\n"
+        # Opt-in hydration: one bounded concurrent fan-out over the
+        # unique principal ids instead of a sequential GET per member.
+        users = {}
+        if detailed:
+            principal_ids = set()
+            for member in memberships:
+                href = (member.get("_links", {}).get("principal") or {}).get("href") or ""
+                if "/users/" in href:
+                    try:
+                        principal_ids.add(int(href.rsplit("/", 1)[-1]))
+                    except ValueError:
+                        pass
+
+            if principal_ids:
+                semaphore = asyncio.Semaphore(10)
+
+                async def fetch_user(uid: int):
+                    async with semaphore:
+                        return await client.get_user(uid)
+
+                ids = list(principal_ids)
+                results = await asyncio.gather(
+                    *(fetch_user(uid) for uid in ids), return_exceptions=True
+                )
+                users = {
+                    uid: user
+                    for uid, user in zip(ids, results)
+                    if not isinstance(user, Exception)
+                }
+
+        # Accumulate in a list and join once; += on a str is O(n^2)
+        # over large member listings
+        parts = [f"✅ **Found {len(memberships)} membership(s):**\n\n"]
         for member in memberships:
             links = member.get("_links", {})
 
@@ -58,23 +94,28 @@ async def list_memberships(
             principal_href = principal_link.get("href", "")
             principal_id = principal_href.split("/")[-1] if principal_href else "N/A"
 
-            text += f"- **{principal_name}** (User ID: {principal_id})\n"
+            parts.append(f"- **{principal_name}** (User ID: {principal_id})\n")
+
+            if detailed:
+                user = users.get(int(principal_id)) if principal_id.isdigit() else None
+                if user:
+                    parts.append(f"  Email: {user.get('email', 'N/A')}\n")
+                    parts.append(f"  Status: {user.get('status', 'N/A')}\n")
 
             # Get project information (only if not filtered by single project)
             if not project_id:
-                project_link = links.get("project", {})
-                project_name = project_link.get("title", "Unknown")
-                text += f"  Project: {project_name}\n"
+                project_name = links.get("project", {}).get("title", "Unknown")
+                parts.append(f"  Project: {project_name}\n")
 
             # Get roles from _links
             role_links = links.get("roles", [])
             if role_links:
                 role_names = [r.get("title", "Unknown") for r in role_links]
-                text += f"  Roles: {', '.join(role_names)}\n"
+                parts.append(f"  Roles: {', '.join(role_names)}\n")
 
-            text += "\n"
+            parts.append("\n")
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return format_error(f"Failed to list memberships: {str(e)}")
@@ -171,7 +212,7 @@ async def create_membership(input: CreateMembershipInput) -> str:
         text = format_success("Membership created successfully!\n\n")
         text += f"**ID**: #{result.get('id', 'N/A')}\n"
 
-        embedded = result.get("_embedded", {})
+        embedded = result.get("_embedded") or EMPTY_MAPPING
         if "project" in embedded:
             text += f"**Project**: {embedded['project'].get('name', 'Unknown')}\n"
         if "principal" in embedded:
@@ -216,7 +257,7 @@ async def update_membership(input: UpdateMembershipInput) -> str:
 
         text = format_success(f"Membership #{input.membership_id} updated successfully!\n\n")
 
-        embedded = result.get("_embedded", {})
+        embedded = result.get("_embedded") or EMPTY_MAPPING
         if "roles" in embedded:
             roles = [r.get("name", "Unknown") for r in embedded["roles"]]
             text += f"**Roles**: {', '.join(roles)}\n"
@@ -1,6 +1,6 @@
 """News management tools for OpenProject."""
 
-import json
+from textwrap import shorten
 from typing import Optional
 from pydantic import BaseModel, Field
 
@@ -10,7 +10,17 @@ from src.utils.formatting import (
     format_news_detail,
     format_success,
     format_error,
+    compact_dumps,
 )
+from src.utils.async_cache import AsyncTTLCache
+
+# sort_by_created=True is the default; build the sort string once at
+# import instead of on every call.
+_SORT_CREATED_DESC = compact_dumps([["created_at", "desc"]])
+
+# Short-lived cache for repeated get_news lookups; writers below
+# invalidate their key so stale reads last at most the TTL.
+_news_cache = AsyncTTLCache(maxsize=512, ttl=30)
 
 
 # ============================================================
@@ -78,14 +88,12 @@ async def list_news(
         # Build filters if project_id provided
         filters = None
         if project_id:
-            filters = json.dumps(
+            filters = compact_dumps(
                 [{"project_id": {"operator": "=", "values": [str(project_id)]}}]
             )
 
         # Build sort criteria
-        sort_by = None
-        if sort_by_created:
-            sort_by = json.dumps([["created_at", "desc"]])
+        sort_by = _SORT_CREATED_DESC if sort_by_created else None
 
         # Fetch news
         result = await client.get_news(
@@ -136,13 +144,9 @@ async def create_news(input: CreateNewsInput) -> str:
     try:
         client = get_client()
 
-        # Prepare data for API
-        data = {
-            "project": input.project_id,
-            "title": input.title,
-            "summary": input.summary,
-            "description": input.description,
-        }
+        # Prepare data for API (the client expects "project", not "project_id")
+        data = input.model_dump(exclude_none=True)
+        data["project"] = data.pop("project_id")
 
         # Create news
         news = await client.create_news(data)
@@ -154,7 +158,7 @@ async def create_news(input: CreateNewsInput) -> str:
         result = format_success(f"News entry created successfully!")
         result += f"\n\n**ID**: {news_id}"
         result += f"\n**Title**: {title}"
-        result += f"\n**Summary**: {input.summary[:100]}..."
+        result += f"\n**Summary**: {shorten(input.summary or '', width=103, placeholder='...')}"
 
         return result
 
@@ -181,8 +185,12 @@ async def get_news(news_id: int) -> str:
     try:
         client = get_client()
 
-        # Fetch news entry
-        news = await client.get_news_item(news_id)
+        # Fetch news entry (memory first, API on miss)
+        cache_key = ("news", news_id)
+        news = _news_cache.get(cache_key)
+        if news is None:
+            news = await client.get_news_item(news_id)
+            _news_cache.set(cache_key, news)
 
         # Format and return
         return format_news_detail(news)
@@ -218,13 +226,7 @@ async def update_news(input: UpdateNewsInput) -> str:
         client = get_client()
 
         # Build update data (only include provided fields)
-        data = {}
-        if input.title is not None:
-            data["title"] = input.title
-        if input.summary is not None:
-            data["summary"] = input.summary
-        if input.description is not None:
-            data["description"] = input.description
+        data = input.model_dump(exclude_none=True, exclude={"news_id"})
 
         if not data:
             return format_error(
@@ -233,12 +235,13 @@ async def update_news(input: UpdateNewsInput) -> str:
 
         # Update news
         news = await client.update_news(input.news_id, data)
+        _news_cache.invalidate(("news", input.news_id))
 
         # Format response
         result = format_success(f"News entry #{input.news_id} updated successfully!")
         result += f"\n\n**Title**: {news.get('title')}"
         if input.summary:
-            result += f"\n**Summary**: {news.get('summary', '')[:100]}..."
+            result += f"\n**Summary**: {shorten(news.get('summary') or '', width=103, placeholder='...')}"
 
         return result
 
@@ -272,6 +275,7 @@ async def delete_news(news_id: int) -> str:
 
         # Delete news
         await client.delete_news(news_id)
+        _news_cache.invalidate(("news", news_id))
 
         return format_success(
             f"News entry #{news_id} has been permanently deleted."
@@ -1,11 +1,31 @@
 """Project management tools."""
 
-import json
-from typing import Optional
+import asyncio
+from typing import Optional, Union
 from src.server import mcp, get_client
-from pydantic import BaseModel, Field
-from src.utils.formatting import format_success, format_error
+from pydantic import BaseModel, ConfigDict, Field
+from src.utils.formatting import format_success, format_error, compact_dumps, SafeDict
 from src.utils.formatting import format_project_list
+from src.utils.async_cache import AsyncTTLCache
+
+# The active_only=True default makes this filter the common case; build
+# the string once at import instead of on every call.
+_ACTIVE_FILTER = compact_dumps([{"active": {"operator": "=", "values": ["t"]}}])
+
+# Short-lived cache for repeated get_project lookups; writers below
+# invalidate their key so stale reads last at most the TTL.
+_project_cache = AsyncTTLCache(maxsize=512, ttl=30)
+
+
+# Fixed part of the get_project response, rendered in one C-level
+# format pass instead of a chain of f-strings.
+_PROJECT_TEMPLATE = (
+    "✅ Project #{id}\n\n"
+    "**Name**: {name}\n"
+    "**Identifier**: {identifier}\n"
+    "**Status**: {status_display}\n"
+    "**Public**: {public_display}\n"
+)
 
 
 @mcp.tool
@@ -23,9 +43,7 @@ async def list_projects(active_only: bool = True, show_hierarchy: bool = False)
         client = get_client()
 
         # Build filters
-        filters = None
-        if active_only:
-            filters = json.dumps([{"active": {"operator": "=", "values": ["t"]}}])
+        filters = _ACTIVE_FILTER if active_only else None
 
         result = await client.get_projects(filters)
         projects = result.get("_embedded", {}).get("elements", [])
@@ -69,22 +87,21 @@ def _format_project_hierarchy(projects: list) -> str:
             root_projects.append(project)
 
     # Recursive function to format project tree
-    def format_tree(project, indent=0):
+    def format_tree(project, parts, indent=0):
         prefix = "  " * indent
-        text = f"{prefix}- **{project.get('name', 'Unnamed')}** (ID: {project.get('id')})\n"
-        text += f"{prefix}  Status: {'Active' if project.get('active') else 'Inactive'}\n"
+        parts.append(
+            f"{prefix}- **{project.get('name', 'Unnamed')}** (ID: {project.get('id')})\n"
+            f"{prefix}  Status: {'Active' if project.get('active') else 'Inactive'}\n"
+        )
 
         # Add children
-        children = parent_map.get(project.get('id'), [])
-        for child in children:
-            text += format_tree(child, indent + 1)
-
-        return text
+        for child in parent_map.get(project.get('id'), []):
+            format_tree(child, parts, indent + 1)
 
     # Format output
-    text = f"✅ Found {len(projects)} project(s) in hierarchical view:\n\n"
+    parts = [f"✅ Found {len(projects)} project(s) in hierarchical view:\n\n"]
     for root in root_projects:
-        text += format_tree(root)
+        format_tree(root, parts)
 
     # List orphaned subprojects (whose parents are not in the result set)
     all_shown_ids = {p.get('id') for p in root_projects}
@@ -93,48 +110,62 @@ def _format_project_hierarchy(projects: list) -> str:
 
     orphaned = [p for p in projects if p.get('id') not in all_shown_ids]
     if orphaned:
-        text += "\n**Subprojects (parent not shown)**:\n"
+        parts.append("\n**Subprojects (parent not shown)**:\n")
         for project in orphaned:
-            text += f"- **{project.get('name', 'Unnamed')}** (ID: {project.get('id')})\n"
+            parts.append(f"- **{project.get('name', 'Unnamed')}** (ID: {project.get('id')})\n")
 
-    return text
+    return "".join(parts)
 
 
 @mcp.tool
-async def get_project(project_id: int) -> str:
+async def get_project(project_id: int, structured: bool = False) -> Union[str, dict]:
     """Get detailed information about a specific project.
 
     Args:
         project_id: The project ID
+        structured: If True, return the raw project dict (plus a short
+            summary) instead of formatted Markdown, so callers can
+            post-process fields without re-parsing text
 
     Returns:
         Detailed project information including description and settings
     """
     try:
         client = get_client()
-        project = await client.get_project(project_id)
-
-        text = f"✅ Project #{project.get('id')}\n\n"
-        text += f"**Name**: {project.get('name', 'Unknown')}\n"
-        text += f"**Identifier**: {project.get('identifier', 'N/A')}\n"
-        text += f"**Status**: {'Active' if project.get('active') else 'Inactive'}\n"
-        text += f"**Public**: {'Yes' if project.get('public') else 'No'}\n"
-
-        if project.get('description'):
-            desc = project['description']
-            if isinstance(desc, dict):
-                desc_text = desc.get('raw', '')
-            else:
-                desc_text = str(desc)
+
+        cache_key = ("project", project_id)
+        project = _project_cache.get(cache_key)
+        if project is None:
+            project = await client.get_project(project_id)
+            _project_cache.set(cache_key, project)
+
+        if structured:
+            return {"summary": f"Project #{project.get('id')}", "project": project}
+
+        # Bind the bound method once; each lookup below is then a plain
+        # local call instead of a repeated attribute lookup
+        pget = project.get
+
+        mapping = SafeDict(project)
+        mapping.setdefault('name', 'Unknown')
+        mapping['status_display'] = 'Active' if pget('active') else 'Inactive'
+        mapping['public_display'] = 'Yes' if pget('public') else 'No'
+        parts = [_PROJECT_TEMPLATE.format_map(mapping)]
+
+        desc = pget('description')
+        if desc:
+            desc_text = desc.get('raw', '') if isinstance(desc, dict) else str(desc)
             if desc_text:
-                text += f"\n**Description**:\n{desc_text}\n"
+                parts.append(f"\n**Description**:\n{desc_text}\n")
 
-        if project.get('createdAt'):
-            text += f"\n**Created**: {project['createdAt']}\n"
-        if project.get('updatedAt'):
-            text += f"**Updated**: {project['updatedAt']}\n"
+        created_at = pget('createdAt')
+        if created_at:
+            parts.append(f"\n**Created**: {created_at}\n")
+        updated_at = pget('updatedAt')
+        if updated_at:
+            parts.append(f"**Updated**: {updated_at}\n")
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return f"❌ Failed to get project: {str(e)}"
@@ -142,6 +173,8 @@ async def get_project(project_id: int) -> str:
 
 class CreateProjectInput(BaseModel):
     """Input model for creating projects."""
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     name: str = Field(..., description="Project name", min_length=1, max_length=255)
     identifier: str = Field(..., description="Project identifier (lowercase, no spaces)", min_length=1, max_length=100)
     description: Optional[str] = Field(None, description="Project description")
@@ -152,6 +185,8 @@ class CreateProjectInput(BaseModel):
 
 class AddSubprojectInput(BaseModel):
     """Input model for adding subprojects."""
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     parent_id: int = Field(..., description="Parent project ID", gt=0)
     name: str = Field(..., description="Subproject name", min_length=1, max_length=255)
     identifier: str = Field(..., description="Subproject identifier (lowercase, no spaces)", min_length=1, max_length=100)
@@ -161,6 +196,8 @@ class AddSubprojectInput(BaseModel):
 
 class UpdateProjectInput(BaseModel):
     """Input model for updating projects."""
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     project_id: int = Field(..., description="Project ID to update", gt=0)
     name: Optional[str] = Field(None, description="New project name", min_length=1, max_length=255)
     identifier: Optional[str] = Field(None, description="New project identifier", min_length=1, max_length=100)
@@ -191,30 +228,18 @@ async def create_project(input: CreateProjectInput) -> str:
     try:
         client = get_client()
 
-        data = {
-            "name": input.name,
-            "identifier": input.identifier,
-        }
-
-        if input.description is not None:
-            data["description"] = input.description
-        if input.public is not None:
-            data["public"] = input.public
-        if input.status is not None:
-            data["status"] = input.status
-        if input.parent_id is not None:
-            data["parent_id"] = input.parent_id
+        # One C-level walk over the model instead of a branch per field
+        data = input.model_dump(exclude_none=True)
 
         result = await client.create_project(data)
 
-        text = format_success("Project created successfully!\n\n")
-        text += f"**Name**: {result.get('name', 'N/A')}\n"
-        text += f"**ID**: #{result.get('id', 'N/A')}\n"
-        text += f"**Identifier**: {result.get('identifier', 'N/A')}\n"
-        text += f"**Public**: {'Yes' if result.get('public') else 'No'}\n"
-        text += f"**Status**: {result.get('status', 'N/A')}\n"
-
-        return text
+        return format_success("Project created successfully!\n\n") + (
+            f"**Name**: {result.get('name', 'N/A')}\n"
+            f"**ID**: #{result.get('id', 'N/A')}\n"
+            f"**Identifier**: {result.get('identifier', 'N/A')}\n"
+            f"**Public**: {'Yes' if result.get('public') else 'No'}\n"
+            f"**Status**: {result.get('status', 'N/A')}\n"
+        )
 
     except Exception as e:
         return format_error(f"Failed to create project: {str(e)}")
@@ -254,28 +279,18 @@ async def add_subproject(input: AddSubprojectInput) -> str:
             return format_error(f"Parent project #{input.parent_id} not found or inaccessible: {str(e)}")
 
         # Create subproject with parent_id
-        data = {
-            "name": input.name,
-            "identifier": input.identifier,
-            "parent_id": input.parent_id,
-        }
-
-        if input.description is not None:
-            data["description"] = input.description
-        if input.public is not None:
-            data["public"] = input.public
+        data = input.model_dump(exclude_none=True)
 
         result = await client.create_project(data)
 
         # Format output with both subproject and parent info
-        text = format_success("Subproject created successfully!\n\n")
-        text += f"**Subproject Name**: {result.get('name', 'N/A')}\n"
-        text += f"**Subproject ID**: #{result.get('id', 'N/A')}\n"
-        text += f"**Identifier**: {result.get('identifier', 'N/A')}\n"
-        text += f"**Public**: {'Yes' if result.get('public') else 'No'}\n"
-        text += f"\n**Parent Project**: {parent_project.get('name', 'N/A')} (ID: #{input.parent_id})\n"
-
-        return text
+        return format_success("Subproject created successfully!\n\n") + (
+            f"**Subproject Name**: {result.get('name', 'N/A')}\n"
+            f"**Subproject ID**: #{result.get('id', 'N/A')}\n"
+            f"**Identifier**: {result.get('identifier', 'N/A')}\n"
+            f"**Public**: {'Yes' if result.get('public') else 'No'}\n"
+            f"\n**Parent Project**: {parent_project.get('name', 'N/A')} (ID: #{input.parent_id})\n"
+        )
 
     except Exception as e:
         return format_error(f"Failed to create subproject: {str(e)}")
@@ -297,32 +312,41 @@ async def get_subprojects(parent_id: int) -> str:
     try:
         client = get_client()
 
-        # Validate parent project exists
-        try:
-            parent_project = await client.get_project(parent_id)
-        except Exception as e:
-            return format_error(f"Parent project #{parent_id} not found: {str(e)}")
-
-        # Get subprojects
-        result = await client.get_subprojects(parent_id)
+        # The parent lookup and the subproject listing are independent;
+        # run them concurrently instead of paying two serial round-trips
+        parent_project, result = await asyncio.gather(
+            client.get_project(parent_id),
+            client.get_subprojects(parent_id),
+            return_exceptions=True,
+        )
+        if isinstance(parent_project, Exception):
+            return format_error(
+                f"Parent project #{parent_id} not found: {str(parent_project)}"
+            )
+        if isinstance(result, Exception):
+            raise result
         subprojects = result.get("_embedded", {}).get("elements", [])
 
         if not subprojects:
             text = format_success(f"No subprojects found for project: {parent_project.get('name', 'Unknown')} (ID: #{parent_id})")
             return text
 
-        text = format_success(f"Subprojects of: {parent_project.get('name', 'Unknown')} (ID: #{parent_id})\n\n")
-        text += f"Found {len(subprojects)} subproject(s):\n\n"
+        parts = [
+            format_success(f"Subprojects of: {parent_project.get('name', 'Unknown')} (ID: #{parent_id})\n\n"),
+            f"Found {len(subprojects)} subproject(s):\n\n",
+        ]
 
         for idx, proj in enumerate(subprojects, 1):
-            text += f"{idx}. **{proj.get('name', 'Unknown')}**\n"
-            text += f"   - ID: #{proj.get('id', 'N/A')}\n"
-            text += f"   - Identifier: {proj.get('identifier', 'N/A')}\n"
-            text += f"   - Status: {'Active' if proj.get('active') else 'Inactive'}\n"
-            text += f"   - Public: {'Yes' if proj.get('public') else 'No'}\n"
-            text += "\n"
+            parts.append(
+                f"{idx}. **{proj.get('name', 'Unknown')}**\n"
+                f"   - ID: #{proj.get('id', 'N/A')}\n"
+                f"   - Identifier: {proj.get('identifier', 'N/A')}\n"
+                f"   - Status: {'Active' if proj.get('active') else 'Inactive'}\n"
+                f"   - Public: {'Yes' if proj.get('public') else 'No'}\n"
+                "\n"
+            )
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return format_error(f"Failed to get subprojects: {str(e)}")
@@ -341,33 +365,20 @@ async def update_project(input: UpdateProjectInput) -> str:
     try:
         client = get_client()
 
-        update_data = {}
-
-        if input.name is not None:
-            update_data["name"] = input.name
-        if input.identifier is not None:
-            update_data["identifier"] = input.identifier
-        if input.description is not None:
-            update_data["description"] = input.description
-        if input.public is not None:
-            update_data["public"] = input.public
-        if input.status is not None:
-            update_data["status"] = input.status
-        if input.parent_id is not None:
-            update_data["parent_id"] = input.parent_id
+        update_data = input.model_dump(exclude_none=True, exclude={"project_id"})
 
         if not update_data:
             return format_error("No fields provided to update")
 
         result = await client.update_project(input.project_id, update_data)
+        _project_cache.invalidate(("project", input.project_id))
 
-        text = format_success(f"Project #{input.project_id} updated successfully!\n\n")
-        text += f"**Name**: {result.get('name', 'N/A')}\n"
-        text += f"**Identifier**: {result.get('identifier', 'N/A')}\n"
-        text += f"**Public**: {'Yes' if result.get('public') else 'No'}\n"
-        text += f"**Status**: {result.get('status', 'N/A')}\n"
-
-        return text
+        return format_success(f"Project #{input.project_id} updated successfully!\n\n") + (
+            f"**Name**: {result.get('name', 'N/A')}\n"
+            f"**Identifier**: {result.get('identifier', 'N/A')}\n"
+            f"**Public**: {'Yes' if result.get('public') else 'No'}\n"
+            f"**Status**: {result.get('status', 'N/A')}\n"
+        )
 
     except Exception as e:
         return format_error(f"Failed to update project: {str(e)}")
@@ -387,6 +398,7 @@ async def delete_project(project_id: int) -> str:
         client = get_client()
 
         success = await client.delete_project(project_id)
+        _project_cache.invalidate(("project", project_id))
 
         if success:
             return format_success(f"Project #{project_id} deleted successfully")
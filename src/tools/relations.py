@@ -1,13 +1,77 @@
 """Work package relation management tools (follows, blocks, relates, etc.)."""
 
-from typing import Optional
-from pydantic import BaseModel, Field
+import asyncio
+import json
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 from src.server import mcp, get_client
-from src.utils.formatting import format_success, format_error
+from src.utils.formatting import format_success, format_error, SafeDict
+from src.utils.async_cache import AsyncTTLCache
+
+
+# Short-lived cache for repeated get_work_package_relation lookups;
+# the update/delete tools invalidate their key.
+_relation_cache = AsyncTTLCache(maxsize=512, ttl=30)
+
+
+# Fixed part of the get_work_package_relation response; the remaining
+# lines depend on which fields the relation carries and stay appends.
+_RELATION_TEMPLATE = (
+    "✅ **Relation #{id}**\n\n"
+    "**Type**: {type}\n"
+)
+
+
+def _id_from_href(href) -> Optional[int]:
+    """Extract the trailing numeric id from an API href, or None."""
+    if not href:
+        return None
+    try:
+        return int(href.rsplit("/", 1)[-1])
+    except ValueError:
+        return None
+
+
+def _format_relation_block(rel: dict, fetched: dict) -> str:
+    """Format one relation as a newline-joined block.
+
+    Args:
+        rel: Relation element from the API
+        fetched: Hydrated work packages keyed by id, for endpoints the
+            response did not embed
+
+    Returns:
+        Multi-line block without a trailing newline
+    """
+    rel_get = rel.get
+    lines = [
+        f"**Relation #{rel_get('id', 'N/A')}**",
+        f"  Type: {rel_get('type', 'Unknown')}",
+    ]
+
+    embedded = rel_get("_embedded", {})
+    links = rel_get("_links", {})
+    for side, label in (("from", "From"), ("to", "To")):
+        wp = embedded.get(side)
+        if wp is None:
+            wp = fetched.get(_id_from_href((links.get(side) or {}).get("href")))
+        if wp is not None:
+            lines.append(f"  {label}: {wp.get('subject', 'Unknown')} (#{wp.get('id', 'N/A')})")
+
+    lag = rel_get('lag')
+    if lag:
+        lines.append(f"  Lag: {lag} days")
+    description = rel_get('description')
+    if description:
+        lines.append(f"  Description: {description}")
+
+    return "\n".join(lines)
 
 
 class CreateRelationInput(BaseModel):
     """Input model for creating work package relations."""
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     from_id: int = Field(..., description="Source work package ID", gt=0)
     to_id: int = Field(..., description="Target work package ID", gt=0)
     type: str = Field(..., description="Relation type (relates, duplicates, blocks, precedes, follows, includes, requires, partof)")
@@ -17,6 +81,8 @@ class CreateRelationInput(BaseModel):
 
 class UpdateRelationInput(BaseModel):
     """Input model for updating work package relations."""
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     relation_id: int = Field(..., description="Relation ID to update", gt=0)
     lag: Optional[int] = Field(None, description="New lag in working days")
     description: Optional[str] = Field(None, description="New description")
@@ -54,35 +120,30 @@ async def create_work_package_relation(input: CreateRelationInput) -> str:
     try:
         client = get_client()
 
-        data = {
-            "from_id": input.from_id,
-            "to_id": input.to_id,
-            "type": input.type,
-        }
-
-        if input.lag is not None:
-            data["lag"] = input.lag
-        if input.description:
-            data["description"] = input.description
+        data = input.model_dump(exclude_none=True)
+        if not data.get("description"):
+            data.pop("description", None)
 
         result = await client.create_work_package_relation(data)
 
-        text = format_success(f"Relation created successfully!\n\n")
-        text += f"**ID**: #{result.get('id', 'N/A')}\n"
-        text += f"**Type**: {result.get('type', 'Unknown')}\n"
+        parts = [
+            format_success(f"Relation created successfully!\n\n"),
+            f"**ID**: #{result.get('id', 'N/A')}\n",
+            f"**Type**: {result.get('type', 'Unknown')}\n",
+        ]
 
         embedded = result.get("_embedded", {})
         if "from" in embedded:
-            text += f"**From**: {embedded['from'].get('subject', 'Unknown')} (#{input.from_id})\n"
+            parts.append(f"**From**: {embedded['from'].get('subject', 'Unknown')} (#{input.from_id})\n")
         if "to" in embedded:
-            text += f"**To**: {embedded['to'].get('subject', 'Unknown')} (#{input.to_id})\n"
+            parts.append(f"**To**: {embedded['to'].get('subject', 'Unknown')} (#{input.to_id})\n")
 
         if result.get('lag'):
-            text += f"**Lag**: {result['lag']} days\n"
+            parts.append(f"**Lag**: {result['lag']} days\n")
         if result.get('description'):
-            text += f"**Description**: {result['description']}\n"
+            parts.append(f"**Description**: {result['description']}\n")
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return format_error(f"Failed to create relation: {str(e)}")
@@ -102,7 +163,6 @@ async def list_work_package_relations(work_package_id: int) -> str:
         client = get_client()
 
         # Get relations for a specific work package
-        import json
         filters = json.dumps([{"involved": {"operator": "=", "values": [str(work_package_id)]}}])
         result = await client.list_work_package_relations(filters)
         relations = result.get("_embedded", {}).get("elements", [])
@@ -110,25 +170,43 @@ async def list_work_package_relations(work_package_id: int) -> str:
         if not relations:
             return f"Work package #{work_package_id} has no relations."
 
-        text = f"✅ **Relations for Work Package #{work_package_id} ({len(relations)}):**\n\n"
+        # Hydrate endpoints the API did not embed: collect the unique
+        # work package ids and fetch them concurrently instead of one
+        # sequential GET per relation side.
+        missing_ids = set()
         for rel in relations:
-            text += f"**Relation #{rel.get('id', 'N/A')}**\n"
-            text += f"  Type: {rel.get('type', 'Unknown')}\n"
-
             embedded = rel.get("_embedded", {})
-            if "from" in embedded:
-                text += f"  From: {embedded['from'].get('subject', 'Unknown')} (#{embedded['from'].get('id', 'N/A')})\n"
-            if "to" in embedded:
-                text += f"  To: {embedded['to'].get('subject', 'Unknown')} (#{embedded['to'].get('id', 'N/A')})\n"
-
-            if rel.get('lag'):
-                text += f"  Lag: {rel['lag']} days\n"
-            if rel.get('description'):
-                text += f"  Description: {rel['description']}\n"
-
-            text += "\n"
-
-        return text
+            links = rel.get("_links", {})
+            for side in ("from", "to"):
+                if side not in embedded:
+                    wp_id = _id_from_href((links.get(side) or {}).get("href"))
+                    if wp_id is not None:
+                        missing_ids.add(wp_id)
+
+        fetched = {}
+        if missing_ids:
+            semaphore = asyncio.Semaphore(16)
+
+            async def fetch_wp(wp_id: int):
+                async with semaphore:
+                    return await client.get_work_package(wp_id)
+
+            ids = list(missing_ids)
+            results = await asyncio.gather(
+                *(fetch_wp(wp_id) for wp_id in ids), return_exceptions=True
+            )
+            fetched = {
+                wp_id: wp
+                for wp_id, wp in zip(ids, results)
+                if not isinstance(wp, Exception)
+            }
+
+        # One pre-sized allocation via join; each block is built once by
+        # the shared formatter
+        header = f"✅ **Relations for Work Package #{work_package_id} ({len(relations)}):**\n\n"
+        return header + "\n\n".join(
+            _format_relation_block(rel, fetched) for rel in relations
+        ) + "\n"
 
     except Exception as e:
         return format_error(f"Failed to list relations: {str(e)}")
@@ -146,23 +224,29 @@ async def get_work_package_relation(relation_id: int) -> str:
     """
     try:
         client = get_client()
-        rel = await client.get_work_package_relation(relation_id)
 
-        text = f"✅ **Relation #{rel.get('id')}**\n\n"
-        text += f"**Type**: {rel.get('type', 'Unknown')}\n"
+        cache_key = ("relation", relation_id)
+        rel = _relation_cache.get(cache_key)
+        if rel is None:
+            rel = await client.get_work_package_relation(relation_id)
+            _relation_cache.set(cache_key, rel)
+
+        mapping = SafeDict(rel)
+        mapping.setdefault('type', 'Unknown')
+        parts = [_RELATION_TEMPLATE.format_map(mapping)]
 
         embedded = rel.get("_embedded", {})
         if "from" in embedded:
-            text += f"**From**: {embedded['from'].get('subject', 'Unknown')} (#{embedded['from'].get('id', 'N/A')})\n"
+            parts.append(f"**From**: {embedded['from'].get('subject', 'Unknown')} (#{embedded['from'].get('id', 'N/A')})\n")
         if "to" in embedded:
-            text += f"**To**: {embedded['to'].get('subject', 'Unknown')} (#{embedded['to'].get('id', 'N/A')})\n"
+            parts.append(f"**To**: {embedded['to'].get('subject', 'Unknown')} (#{embedded['to'].get('id', 'N/A')})\n")
 
         if rel.get('lag'):
-            text += f"**Lag**: {rel['lag']} days\n"
+            parts.append(f"**Lag**: {rel['lag']} days\n")
         if rel.get('description'):
-            text += f"**Description**: {rel['description']}\n"
+            parts.append(f"**Description**: {rel['description']}\n")
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return format_error(f"Failed to get relation: {str(e)}")
@@ -181,27 +265,25 @@ async def update_work_package_relation(input: UpdateRelationInput) -> str:
     try:
         client = get_client()
 
-        update_data = {}
-
-        if input.lag is not None:
-            update_data["lag"] = input.lag
-        if input.description is not None:
-            update_data["description"] = input.description
+        update_data = input.model_dump(exclude_none=True, exclude={"relation_id"})
 
         if not update_data:
             return format_error("No fields provided to update")
 
         result = await client.update_work_package_relation(input.relation_id, update_data)
+        _relation_cache.invalidate(("relation", input.relation_id))
 
-        text = format_success(f"Relation #{input.relation_id} updated successfully!\n\n")
-        text += f"**Type**: {result.get('type', 'Unknown')}\n"
+        parts = [
+            format_success(f"Relation #{input.relation_id} updated successfully!\n\n"),
+            f"**Type**: {result.get('type', 'Unknown')}\n",
+        ]
 
         if result.get('lag'):
-            text += f"**Lag**: {result['lag']} days\n"
+            parts.append(f"**Lag**: {result['lag']} days\n")
         if result.get('description'):
-            text += f"**Description**: {result['description']}\n"
+            parts.append(f"**Description**: {result['description']}\n")
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return format_error(f"Failed to update relation: {str(e)}")
@@ -221,6 +303,7 @@ async def delete_work_package_relation(relation_id: int) -> str:
         client = get_client()
 
         success = await client.delete_work_package_relation(relation_id)
+        _relation_cache.invalidate(("relation", relation_id))
 
         if success:
             return format_success(f"Relation #{relation_id} deleted successfully")
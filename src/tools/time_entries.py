@@ -1,13 +1,91 @@
 """Time entry management tools for time tracking."""
 
+from operator import itemgetter
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from src.server import mcp, get_client
-from src.utils.formatting import format_success, format_error
+from src.utils.formatting import format_error, compact_dumps, eq_filter, op_filter, EMPTY_MAPPING
+from src.utils.async_cache import cached
+
+# list_time_entry_activities falls back to these well-known defaults when
+# the endpoint returns nothing or is unavailable; build the text once at
+# import instead of re-concatenating it on every fallback hit.
+_FALLBACK_ACTIVITIES_BASE = (
+    "⚠️  **Common Time Entry Activities:**\n\n"
+    "- **Management** (ID: 1)\n"
+    "- **Specification** (ID: 2)\n"
+    "- **Development** (ID: 3)\n"
+    "- **Testing** (ID: 4)\n"
+)
+_FALLBACK_ACTIVITIES_EMPTY = (
+    _FALLBACK_ACTIVITIES_BASE
+    + "\nNote: Use these IDs when creating/updating time entries.\n"
+)
+_FALLBACK_ACTIVITIES_ERROR = (
+    _FALLBACK_ACTIVITIES_BASE
+    + "\nNote: API endpoint unavailable. Use these common IDs.\n"
+)
+_ACTIVITIES_HEADER = "✅ **Available Time Entry Activities:**\n\n"
+
+# Indexed by `count == 1`; keeps the header format free of a conditional
+# so cached or templated headers stay identical for every plural count.
+_PLURAL = ("entries", "entry")
+
+# Success prefix inlined on hot paths; format_success is one extra frame
+# per call for the same "✅ " + message concatenation.
+_OK = "✅ "
+
+# One C-level lookup for the three fields every entry carries, instead of
+# three .get calls per iteration; the except branch covers partial rows.
+_entry_getter = itemgetter("id", "hours", "spentOn")
+
+# Fixed per-entry skeleton; %-formatting runs fully in C, so the hot loop
+# does one formatted append instead of three f-string evaluations.
+_ENTRY_TMPL = "**Time Entry #%s**\n  Hours: %s\n  Date: %s\n"
+
+
+def _entry_blocks(entries):
+    """Yield one formatted block per time entry.
+
+    The MCP transport needs a single string, so the blocks feed a single
+    str.join; generating them lazily keeps the working set at one block
+    at a time instead of a parts list entry per output line.
+
+    Args:
+        entries: Time entry elements from the API
+
+    Yields:
+        str: Multi-line block for one entry, including trailing newline
+    """
+    for entry in entries:
+        try:
+            entry_id, hours, spent_on = _entry_getter(entry)
+        except KeyError:
+            entry_id = entry.get("id", "N/A")
+            hours = entry.get("hours", 0)
+            spent_on = entry.get("spentOn", "N/A")
+
+        lines = [_ENTRY_TMPL % (entry_id, hours, spent_on)]
+
+        embedded = entry.get("_embedded") or EMPTY_MAPPING
+        if "workPackage" in embedded:
+            lines.append(f"  Work Package: {embedded['workPackage'].get('subject', 'Unknown')}\n")
+        if "user" in embedded:
+            lines.append(f"  User: {embedded['user'].get('name', 'Unknown')}\n")
+        if "activity" in embedded:
+            lines.append(f"  Activity: {embedded['activity'].get('name', 'Unknown')}\n")
+
+        if entry.get('comment', {}).get('raw'):
+            lines.append(f"  Comment: {entry['comment']['raw']}\n")
+
+        lines.append("\n")
+        yield "".join(lines)
 
 
 class CreateTimeEntryInput(BaseModel):
     """Input model for creating time entries."""
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     work_package_id: int = Field(..., description="Work package ID", gt=0)
     hours: float = Field(..., description="Hours spent", gt=0)
     spent_on: str = Field(..., description="Date spent (YYYY-MM-DD)")
@@ -17,6 +95,8 @@ class CreateTimeEntryInput(BaseModel):
 
 class UpdateTimeEntryInput(BaseModel):
     """Input model for updating time entries."""
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     time_entry_id: int = Field(..., description="Time entry ID to update", gt=0)
     hours: Optional[float] = Field(None, description="New hours spent", gt=0)
     spent_on: Optional[str] = Field(None, description="New date (YYYY-MM-DD)")
@@ -45,50 +125,33 @@ async def list_time_entries(
     try:
         client = get_client()
 
-        import json
         filters = []
         if work_package_id:
-            filters.append({"work_package": {"operator": "=", "values": [str(work_package_id)]}})
+            filters.append(eq_filter("work_package", work_package_id))
         if user_id:
-            filters.append({"user": {"operator": "=", "values": [str(user_id)]}})
+            filters.append(eq_filter("user", user_id))
         if from_date:
-            filters.append({"spent_on": {"operator": ">=", "values": [from_date]}})
+            filters.append(op_filter("spent_on", ">=", from_date))
         if to_date:
-            filters.append({"spent_on": {"operator": "<=", "values": [to_date]}})
+            filters.append(op_filter("spent_on", "<=", to_date))
 
-        filters_json = json.dumps(filters) if filters else None
+        filters_json = compact_dumps(filters) if filters else None
 
         result = await client.get_time_entries(filters_json)
-        entries = result.get("_embedded", {}).get("elements", [])
+        entries = (result.get("_embedded") or EMPTY_MAPPING).get("elements", [])
 
         if not entries:
             return "No time entries found."
 
-        text = f"✅ **Found {len(entries)} time entr{'y' if len(entries) == 1 else 'ies'}:**\n\n"
-        total_hours = 0
+        total_hours = sum(entry.get("hours", 0) for entry in entries)
 
-        for entry in entries:
-            text += f"**Time Entry #{entry.get('id', 'N/A')}**\n"
-            text += f"  Hours: {entry.get('hours', 0)}\n"
-            text += f"  Date: {entry.get('spentOn', 'N/A')}\n"
-
-            embedded = entry.get("_embedded", {})
-            if "workPackage" in embedded:
-                text += f"  Work Package: {embedded['workPackage'].get('subject', 'Unknown')}\n"
-            if "user" in embedded:
-                text += f"  User: {embedded['user'].get('name', 'Unknown')}\n"
-            if "activity" in embedded:
-                text += f"  Activity: {embedded['activity'].get('name', 'Unknown')}\n"
-
-            if entry.get('comment', {}).get('raw'):
-                text += f"  Comment: {entry['comment']['raw']}\n"
-
-            total_hours += entry.get('hours', 0)
-            text += "\n"
-
-        text += f"**Total Hours**: {total_hours}\n"
-
-        return text
+        n = len(entries)
+        header = f"✅ **Found {n} time {_PLURAL[n == 1]}:**\n\n"
+        return (
+            header
+            + "".join(_entry_blocks(entries))
+            + f"**Total Hours**: {total_hours}\n"
+        )
 
     except Exception as e:
         return format_error(f"Failed to list time entries: {str(e)}")
@@ -122,24 +185,21 @@ async def create_time_entry(input: CreateTimeEntryInput) -> str:
     try:
         client = get_client()
 
-        data = {
-            "work_package_id": input.work_package_id,
-            "hours": str(input.hours),
-            "spent_on": input.spent_on,
-            "activity_id": input.activity_id,
-        }
-
-        if input.comment:
-            data["comment"] = input.comment
+        # One model_dump instead of per-field attribute reads; the client
+        # expects hours as a string and no empty comment key.
+        data = input.model_dump(exclude_none=True)
+        data["hours"] = str(data["hours"])
+        if not data.get("comment"):
+            data.pop("comment", None)
 
         result = await client.create_time_entry(data)
 
-        text = format_success(f"Time entry created successfully!\n\n")
+        text = _OK + "Time entry created successfully!\n\n"
         text += f"**ID**: #{result.get('id', 'N/A')}\n"
         text += f"**Hours**: {result.get('hours', 0)}\n"
         text += f"**Date**: {result.get('spentOn', 'N/A')}\n"
 
-        embedded = result.get("_embedded", {})
+        embedded = result.get("_embedded") or EMPTY_MAPPING
         if "workPackage" in embedded:
             text += f"**Work Package**: {embedded['workPackage'].get('subject', 'Unknown')}\n"
         if "activity" in embedded:
@@ -167,27 +227,20 @@ async def update_time_entry(input: UpdateTimeEntryInput) -> str:
     try:
         client = get_client()
 
-        update_data = {}
-
-        if input.hours is not None:
-            update_data["hours"] = str(input.hours)
-        if input.spent_on is not None:
-            update_data["spent_on"] = input.spent_on
-        if input.activity_id is not None:
-            update_data["activity_id"] = input.activity_id
-        if input.comment is not None:
-            update_data["comment"] = input.comment
+        update_data = input.model_dump(exclude_none=True, exclude={"time_entry_id"})
+        if "hours" in update_data:
+            update_data["hours"] = str(update_data["hours"])
 
         if not update_data:
             return format_error("No fields provided to update")
 
         result = await client.update_time_entry(input.time_entry_id, update_data)
 
-        text = format_success(f"Time entry #{input.time_entry_id} updated successfully!\n\n")
+        text = _OK + f"Time entry #{input.time_entry_id} updated successfully!\n\n"
         text += f"**Hours**: {result.get('hours', 0)}\n"
         text += f"**Date**: {result.get('spentOn', 'N/A')}\n"
 
-        embedded = result.get("_embedded", {})
+        embedded = result.get("_embedded") or EMPTY_MAPPING
         if "activity" in embedded:
             text += f"**Activity**: {embedded['activity'].get('name', 'Unknown')}\n"
 
@@ -216,7 +269,7 @@ async def delete_time_entry(time_entry_id: int) -> str:
         success = await client.delete_time_entry(time_entry_id)
 
         if success:
-            return format_success(f"Time entry #{time_entry_id} deleted successfully")
+            return _OK + f"Time entry #{time_entry_id} deleted successfully"
         else:
             return format_error(f"Failed to delete time entry #{time_entry_id}")
 
@@ -225,6 +278,7 @@ async def delete_time_entry(time_entry_id: int) -> str:
 
 
 @mcp.tool
+@cached(ttl=3600, should_cache=lambda text: text.startswith("✅"))
 async def list_time_entry_activities() -> str:
     """List available time entry activities.
 
@@ -238,32 +292,20 @@ async def list_time_entry_activities() -> str:
         client = get_client()
 
         result = await client.get_time_entry_activities()
-        activities = result.get("_embedded", {}).get("elements", [])
+        activities = (result.get("_embedded") or EMPTY_MAPPING).get("elements", [])
 
         if not activities:
             # Fallback to common activity IDs
-            text = "⚠️  **Common Time Entry Activities:**\n\n"
-            text += "- **Management** (ID: 1)\n"
-            text += "- **Specification** (ID: 2)\n"
-            text += "- **Development** (ID: 3)\n"
-            text += "- **Testing** (ID: 4)\n"
-            text += "\nNote: Use these IDs when creating/updating time entries.\n"
-            return text
-
-        text = "✅ **Available Time Entry Activities:**\n\n"
+            return _FALLBACK_ACTIVITIES_EMPTY
+
+        parts = [_ACTIVITIES_HEADER]
         for activity in activities:
-            text += f"- **{activity.get('name', 'Unnamed')}** (ID: {activity.get('id', 'N/A')})\n"
+            parts.append(f"- **{activity.get('name', 'Unnamed')}** (ID: {activity.get('id', 'N/A')})\n")
             if activity.get("isDefault"):
-                text += "  ✓ Default activity\n"
+                parts.append("  ✓ Default activity\n")
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         # Return common activities on error
-        text = "⚠️  **Common Time Entry Activities:**\n\n"
-        text += "- **Management** (ID: 1)\n"
-        text += "- **Specification** (ID: 2)\n"
-        text += "- **Development** (ID: 3)\n"
-        text += "- **Testing** (ID: 4)\n"
-        text += "\nNote: API endpoint unavailable. Use these common IDs.\n"
-        return text
+        return _FALLBACK_ACTIVITIES_ERROR
@@ -1,8 +1,9 @@
 """User and role management tools."""
 
-from typing import Optional
+from typing import List, Optional
 from src.server import mcp, get_client
-from src.utils.formatting import format_success, format_error
+from src.utils.formatting import format_success, format_error, compact_dumps, eq_filter, op_filter, EMPTY_MAPPING
+from src.utils.async_cache import cached
 
 
 @mcp.tool
@@ -21,30 +22,31 @@ async def list_users(name: Optional[str] = None, status: Optional[str] = None) -
 
         filters = []
         if name:
-            filters.append({"name": {"operator": "~", "values": [name]}})
+            filters.append(op_filter("name", "~", name))
         if status:
-            filters.append({"status": {"operator": "=", "values": [status]}})
+            filters.append(eq_filter("status", status))
 
-        import json
-        filters_json = json.dumps(filters) if filters else None
+        filters_json = compact_dumps(filters) if filters else None
 
         result = await client.get_users(filters_json)
-        users = result.get("_embedded", {}).get("elements", [])
+        users = (result.get("_embedded") or EMPTY_MAPPING).get("elements", [])
 
         if not users:
             return "No users found."
 
-        text = f"✅ **Found {len(users)} user(s):**\n\n"
+        # Accumulate in a list and join once; += on a str is O(n^2)
+        # over large user listings
+        parts = [f"✅ **Found {len(users)} user(s):**\n\n"]
         for user in users:
-            text += f"- **{user.get('name', 'Unknown')}** (ID: {user.get('id', 'N/A')})\n"
-            text += f"  Email: {user.get('email', 'N/A')}\n"
-            text += f"  Login: {user.get('login', 'N/A')}\n"
-            text += f"  Status: {user.get('status', 'N/A')}\n"
+            parts.append(f"- **{user.get('name', 'Unknown')}** (ID: {user.get('id', 'N/A')})\n")
+            parts.append(f"  Email: {user.get('email', 'N/A')}\n")
+            parts.append(f"  Login: {user.get('login', 'N/A')}\n")
+            parts.append(f"  Status: {user.get('status', 'N/A')}\n")
             if user.get("admin"):
-                text += "  ✓ Administrator\n"
-            text += "\n"
+                parts.append("  ✓ Administrator\n")
+            parts.append("\n")
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return format_error(f"Failed to list users: {str(e)}")
@@ -83,6 +85,7 @@ async def get_user(user_id: int) -> str:
 
 
 @mcp.tool
+@cached(ttl=300, should_cache=lambda text: text.startswith("✅"))
 async def list_roles() -> str:
     """List available user roles in OpenProject.
 
@@ -93,16 +96,16 @@ async def list_roles() -> str:
         client = get_client()
 
         result = await client.get_roles()
-        roles = result.get("_embedded", {}).get("elements", [])
+        roles = (result.get("_embedded") or EMPTY_MAPPING).get("elements", [])
 
         if not roles:
             return "No roles found."
 
-        text = "✅ **Available Roles:**\n\n"
+        parts = ["✅ **Available Roles:**\n\n"]
         for role in roles:
-            text += f"- **{role.get('name', 'Unnamed')}** (ID: {role.get('id', 'N/A')})\n"
+            parts.append(f"- **{role.get('name', 'Unnamed')}** (ID: {role.get('id', 'N/A')})\n")
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return format_error(f"Failed to list roles: {str(e)}")
@@ -122,20 +125,22 @@ async def get_role(role_id: int) -> str:
         client = get_client()
         role = await client.get_role(role_id)
 
-        text = f"✅ **Role #{role.get('id')}**\n\n"
-        text += f"**Name**: {role.get('name', 'Unknown')}\n"
+        parts = [
+            f"✅ **Role #{role.get('id')}**\n\n",
+            f"**Name**: {role.get('name', 'Unknown')}\n",
+        ]
 
         # Add permissions if available
         if "_embedded" in role and "permissions" in role["_embedded"]:
             perms = role["_embedded"]["permissions"]
             if perms:
-                text += f"\n**Permissions** ({len(perms)}):\n"
+                parts.append(f"\n**Permissions** ({len(perms)}):\n")
                 for perm in perms[:10]:  # Show first 10
-                    text += f"- {perm.get('name', 'Unknown')}\n"
+                    parts.append(f"- {perm.get('name', 'Unknown')}\n")
                 if len(perms) > 10:
-                    text += f"... and {len(perms) - 10} more\n"
+                    parts.append(f"... and {len(perms) - 10} more\n")
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return format_error(f"Failed to get role: {str(e)}")
@@ -155,30 +160,73 @@ async def list_user_projects(user_id: int) -> str:
     try:
         client = get_client()
 
-        import json
-        filters = json.dumps([{"principal": {"operator": "=", "values": [str(user_id)]}}])
-
-        result = await client.get_memberships(filters)
-        memberships = result.get("_embedded", {}).get("elements", [])
+        result = await client.get_memberships(user_id=user_id)
+        memberships = (result.get("_embedded") or EMPTY_MAPPING).get("elements", [])
 
         if not memberships:
             return f"User #{user_id} is not a member of any projects."
 
-        text = f"✅ **Projects for User #{user_id} ({len(memberships)}):**\n\n"
+        parts = [f"✅ **Projects for User #{user_id} ({len(memberships)}):**\n\n"]
         for member in memberships:
-            embedded = member.get("_embedded", {})
+            embedded = member.get("_embedded") or EMPTY_MAPPING
 
             if "project" in embedded:
                 project_name = embedded["project"].get("name", "Unknown")
-                text += f"- **{project_name}**\n"
+                parts.append(f"- **{project_name}**\n")
 
             if "roles" in embedded:
                 roles = [r.get("name", "Unknown") for r in embedded["roles"]]
-                text += f"  Roles: {', '.join(roles)}\n"
+                parts.append(f"  Roles: {', '.join(roles)}\n")
 
-            text += "\n"
+            parts.append("\n")
 
-        return text
+        return "".join(parts)
 
     except Exception as e:
         return format_error(f"Failed to list user projects: {str(e)}")
+
+
+@mcp.tool
+async def list_user_projects_bulk(user_ids: List[int]) -> str:
+    """List project memberships for several users in one call.
+
+    A single multi-value principal filter replaces one membership
+    request per user, so the round-trip count no longer scales with the
+    number of users.
+
+    Args:
+        user_ids: User IDs to look up
+
+    Returns:
+        Project memberships grouped per user
+    """
+    try:
+        client = get_client()
+
+        grouped = await client.get_memberships_bulk(user_ids)
+
+        parts = [f"✅ **Project memberships for {len(user_ids)} user(s):**\n\n"]
+        for user_id in user_ids:
+            memberships = grouped.get(user_id, [])
+
+            if not memberships:
+                parts.append(f"**User #{user_id}**: no project memberships\n\n")
+                continue
+
+            parts.append(f"**User #{user_id}** ({len(memberships)}):\n")
+            for member in memberships:
+                embedded = member.get("_embedded") or EMPTY_MAPPING
+
+                if "project" in embedded:
+                    parts.append(f"- **{embedded['project'].get('name', 'Unknown')}**\n")
+
+                if "roles" in embedded:
+                    roles = [r.get("name", "Unknown") for r in embedded["roles"]]
+                    parts.append(f"  Roles: {', '.join(roles)}\n")
+
+            parts.append("\n")
+
+        return "".join(parts)
+
+    except Exception as e:
+        return format_error(f"Failed to list user projects in bulk: {str(e)}")
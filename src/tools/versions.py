@@ -1,13 +1,25 @@
 """Version/milestone management tools."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from src.server import mcp, get_client
-from src.utils.formatting import format_success, format_error
+from src.utils.formatting import format_error, EMPTY_MAPPING
+from src.utils.async_cache import AsyncTTLCache
+
+# Short-lived cache for the formatted per-project listing; the version
+# writers below clear it (they only know the version id, not its
+# project, so the whole cache goes).
+_versions_cache = AsyncTTLCache(maxsize=128, ttl=30)
+
+# Success prefix inlined on hot paths; format_success is one extra frame
+# per call for the same "✅ " + message concatenation.
+_OK = "✅ "
 
 
 class CreateVersionInput(BaseModel):
     """Input model for creating versions."""
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     project_id: int = Field(..., description="Project ID", gt=0)
     name: str = Field(..., description="Version name", min_length=1, max_length=255)
     description: Optional[str] = Field(None, description="Version description")
@@ -18,6 +30,8 @@ class CreateVersionInput(BaseModel):
 
 class UpdateVersionInput(BaseModel):
     """Input model for updating versions."""
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     version_id: int = Field(..., description="Version ID to update", gt=0)
     name: Optional[str] = Field(None, description="New version name", min_length=1, max_length=255)
     description: Optional[str] = Field(None, description="New version description")
@@ -39,32 +53,41 @@ async def list_versions(project_id: int) -> str:
     try:
         client = get_client()
 
+        cache_key = ("versions", project_id)
+        cached_text = _versions_cache.get(cache_key)
+        if cached_text is not None:
+            return cached_text
+
         result = await client.get_versions(project_id)
-        versions = result.get("_embedded", {}).get("elements", [])
+        versions = (result.get("_embedded") or EMPTY_MAPPING).get("elements", [])
 
         if not versions:
             return f"No versions found for project #{project_id}."
 
-        text = f"✅ **Versions for Project #{project_id} ({len(versions)}):**\n\n"
+        # Accumulate in a list and join once; += on a str is O(n^2)
+        # over large version listings
+        parts = [f"✅ **Versions for Project #{project_id} ({len(versions)}):**\n\n"]
         for version in versions:
-            text += f"**{version.get('name', 'Unnamed')}** (ID: {version.get('id', 'N/A')})\n"
+            parts.append(f"**{version.get('name', 'Unnamed')}** (ID: {version.get('id', 'N/A')})\n")
 
             if version.get('description', {}).get('raw'):
-                text += f"  Description: {version['description']['raw']}\n"
+                parts.append(f"  Description: {version['description']['raw']}\n")
 
             if version.get('startDate'):
-                text += f"  Start: {version['startDate']}\n"
+                parts.append(f"  Start: {version['startDate']}\n")
             if version.get('endDate'):
-                text += f"  End: {version['endDate']}\n"
+                parts.append(f"  End: {version['endDate']}\n")
 
-            text += f"  Status: {version.get('status', 'Unknown')}\n"
+            parts.append(f"  Status: {version.get('status', 'Unknown')}\n")
 
             if "_embedded" in version and "definingProject" in version["_embedded"]:
                 project = version["_embedded"]["definingProject"]
-                text += f"  Project: {project.get('name', 'Unknown')}\n"
+                parts.append(f"  Project: {project.get('name', 'Unknown')}\n")
 
-            text += "\n"
+            parts.append("\n")
 
+        text = "".join(parts)
+        _versions_cache.set(cache_key, text)
         return text
 
     except Exception as e:
@@ -136,22 +159,17 @@ async def create_version(input: CreateVersionInput) -> str:
     try:
         client = get_client()
 
-        data = {
-            "name": input.name,
-        }
-
-        if input.description:
-            data["description"] = input.description
-        if input.start_date:
-            data["start_date"] = input.start_date
-        if input.due_date:
-            data["due_date"] = input.due_date
-        if input.status:
-            data["status"] = input.status
+        # One model_dump instead of per-field attribute reads; drop empty
+        # optional values the old truthiness checks skipped.
+        data = input.model_dump(exclude_none=True, exclude={"project_id"})
+        for key in ("description", "start_date", "due_date", "status"):
+            if not data.get(key):
+                data.pop(key, None)
 
         result = await client.create_version(input.project_id, data)
+        _versions_cache.invalidate(("versions", input.project_id))
 
-        text = format_success("Version created successfully!\n\n")
+        text = _OK + "Version created successfully!\n\n"
         text += f"**Name**: {result.get('name', 'N/A')}\n"
         text += f"**ID**: #{result.get('id', 'N/A')}\n"
 
@@ -193,25 +211,15 @@ async def update_version(input: UpdateVersionInput) -> str:
         client = get_client()
 
         # Build update data dict (only include provided fields)
-        data = {}
-
-        if input.name is not None:
-            data["name"] = input.name
-        if input.description is not None:
-            data["description"] = input.description
-        if input.start_date is not None:
-            data["start_date"] = input.start_date
-        if input.due_date is not None:
-            data["due_date"] = input.due_date
-        if input.status is not None:
-            data["status"] = input.status
+        data = input.model_dump(exclude_none=True, exclude={"version_id"})
 
         if not data:
             return format_error("No fields provided to update")
 
         result = await client.update_version(input.version_id, data)
+        _versions_cache.clear()
 
-        text = format_success(f"Version #{input.version_id} updated successfully!\n\n")
+        text = _OK + f"Version #{input.version_id} updated successfully!\n\n"
         text += f"**Name**: {result.get('name', 'N/A')}\n"
 
         if result.get('description', {}).get('raw'):
@@ -247,9 +255,10 @@ async def delete_version(version_id: int) -> str:
         client = get_client()
 
         success = await client.delete_version(version_id)
+        _versions_cache.clear()
 
         if success:
-            return format_success(f"Version #{version_id} deleted successfully")
+            return _OK + f"Version #{version_id} deleted successfully"
         else:
             return format_error(f"Failed to delete version #{version_id}")
 
@@ -1,6 +1,8 @@
 """Weekly report generation tools."""
 
+import asyncio
 import json
+import logging
 from typing import Optional
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
@@ -11,6 +13,60 @@ from src.utils.report_formatter import (
     format_weekly_report_markdown,
     format_report_data_json,
 )
+from src.utils.async_cache import AsyncTTLCache
+
+logger = logging.getLogger(__name__)
+
+# Project info and memberships change on the order of days; a short TTL
+# lets back-to-back report generations (retries, format tweaks) skip
+# those two round-trips entirely.
+_report_cache = AsyncTTLCache(maxsize=128, ttl=60)
+
+
+async def _cached_fetch(key, coro_factory):
+    """Serve key from the report cache, calling coro_factory on a miss.
+
+    Args:
+        key: Cache key for the lookup
+        coro_factory: Zero-argument callable returning the coroutine to
+            await on a miss; deferring creation keeps cache hits from
+            leaving an unawaited coroutine behind
+
+    Returns:
+        The cached or freshly fetched value
+    """
+    value = _report_cache.get(key)
+    if value is None:
+        value = await coro_factory()
+        _report_cache.set(key, value)
+    return value
+
+
+def _time_entry_filters(project_id: int, from_date: str, to_date: str) -> str:
+    """Build the spent-on/project filter string for the report window.
+
+    Args:
+        project_id: Project to restrict time entries to
+        from_date: Window start (YYYY-MM-DD)
+        to_date: Window end (YYYY-MM-DD)
+
+    Returns:
+        JSON-encoded filter string for client.get_time_entries
+    """
+    return json.dumps([
+        {
+            "spentOn": {
+                "operator": "<>d",
+                "values": [from_date, to_date]
+            }
+        },
+        {
+            "project": {
+                "operator": "=",
+                "values": [str(project_id)]
+            }
+        }
+    ])
 
 
 class GenerateWeeklyReportInput(BaseModel):
@@ -82,6 +138,29 @@ async def _fetch_all_project_work_packages(client, project_id: int) -> list:
 
 
 
+async def _fetch_wp_relations(client, semaphore, wp_id: int) -> list:
+    """Fetch relations involving one work package, absorbing failures.
+
+    Relations are optional report data, so a failed lookup contributes
+    an empty list instead of aborting the report.
+
+    Args:
+        client: OpenProject client instance
+        semaphore: Concurrency gate shared by the report's fan-out
+        wp_id: Work package ID to look up
+
+    Returns:
+        List of relation elements (empty on error)
+    """
+    filters = json.dumps([{"involved": {"operator": "=", "values": [str(wp_id)]}}])
+    async with semaphore:
+        try:
+            result = await client.list_work_package_relations(filters)
+        except Exception:
+            return []
+    return result.get("_embedded", {}).get("elements", [])
+
+
 async def _generate_weekly_report_impl(input: GenerateWeeklyReportInput) -> str:
     """Internal implementation of weekly report generation.
     
@@ -101,21 +180,27 @@ async def _generate_weekly_report_impl(input: GenerateWeeklyReportInput) -> str:
         if from_dt > to_dt:
             return format_error("from_date must be before or equal to to_date")
         
-        # Collect all data in parallel (async)
-        # 1. Get project info
-        project = await client.get_project(input.project_id)
-        
-        # 2. Get work packages - FETCH ALL PROJECT WPs WITHOUT DATE FILTER
-        # IMPORTANT: We fetch ALL work packages for the project to ensure we don't miss
+        # Build filters before the fan-out so nothing is recomputed
+        # between awaits
+        time_filters = _time_entry_filters(input.project_id, input.from_date, input.to_date)
+
+        # Collect all data in parallel: project info, work packages,
+        # members and time entries are independent, so one gather makes
+        # the wall-clock cost the slowest call instead of the sum.
+        #
+        # Work packages are fetched WITHOUT a date filter - we must not miss
         # closed/completed tasks. OpenProject API v3 has NO closedAt filter, and using
         # updatedAt filter misses tasks that were closed but not updated during the week.
-        # 
         # Strategy: Fetch everything, then filter client-side for relevance
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info(f"Fetching all work packages for project {input.project_id}")
-        all_work_packages = await _fetch_all_project_work_packages(client, input.project_id)
+        project, all_work_packages, members_result, te_result = await asyncio.gather(
+            _cached_fetch(("project", input.project_id),
+                          lambda: client.get_project(input.project_id)),
+            _fetch_all_project_work_packages(client, input.project_id),
+            _cached_fetch(("memberships", input.project_id),
+                          lambda: client.get_memberships(project_id=input.project_id)),
+            client.get_time_entries(filters=time_filters),
+        )
         logger.info(f"Total work packages fetched: {len(all_work_packages)}")
         
         # Filter to keep only WPs relevant to the report week
@@ -188,43 +273,17 @@ async def _generate_weekly_report_impl(input: GenerateWeeklyReportInput) -> str:
             logger.info(f"    {status}: {count}")
 
         
-        # 3. Get project members
-        members_result = await client.get_memberships(project_id=input.project_id)
         members = members_result.get("_embedded", {}).get("elements", [])
-        
-        # 4. Get time entries within date range
-        time_filters = json.dumps([
-            {
-                "spentOn": {
-                    "operator": "<>d",
-                    "values": [input.from_date, input.to_date]
-                }
-            },
-            {
-                "project": {
-                    "operator": "=",
-                    "values": [str(input.project_id)]
-                }
-            }
-        ])
-        
-        te_result = await client.get_time_entries(filters=time_filters)
         time_entries = te_result.get("_embedded", {}).get("elements", [])
         
-        # 5. Get relations for dependency analysis (optional, may not have many)
-        relations = []
-        try:
-            # Get relations for all work packages (this might be slow for large projects)
-            # For now, we'll collect relations from the first few WPs only
-            for wp in work_packages[:10]:  # Limit to avoid too many API calls
-                try:
-                    rel_result = await client.get_relations(work_package_id=wp['id'])
-                    wp_relations = rel_result.get("_embedded", {}).get("elements", [])
-                    relations.extend(wp_relations)
-                except:
-                    pass  # Ignore if relations endpoint fails
-        except:
-            pass  # Relations are optional
+        # 5. Get relations for dependency analysis (optional, may not have many).
+        # Fan out over the first few WPs with bounded concurrency instead of
+        # one sequential call per work package; failures yield empty lists.
+        semaphore = asyncio.Semaphore(8)
+        rel_lists = await asyncio.gather(
+            *(_fetch_wp_relations(client, semaphore, wp['id']) for wp in work_packages[:10])
+        )
+        relations = [rel for wp_relations in rel_lists for rel in wp_relations]
         
         # Generate report based on format
         if input.format.lower() == 'json':
@@ -343,15 +402,18 @@ async def get_report_data(input: GetReportDataInput) -> str:
         if from_dt > to_dt:
             return format_error("from_date must be before or equal to to_date")
         
-        # Collect data (with same fix as generate_weekly_report)
-        project = await client.get_project(input.project_id)
-        
-        # Use same improved filtering logic as main report function
-        import logging
-        logger = logging.getLogger(__name__)
-        
+        # Collect data in parallel (same fan-out as generate_weekly_report)
+        time_filters = _time_entry_filters(input.project_id, input.from_date, input.to_date)
+
         logger.info(f"[get_report_data] Fetching all work packages for project {input.project_id}")
-        all_work_packages = await _fetch_all_project_work_packages(client, input.project_id)
+        project, all_work_packages, members_result, te_result = await asyncio.gather(
+            _cached_fetch(("project", input.project_id),
+                          lambda: client.get_project(input.project_id)),
+            _fetch_all_project_work_packages(client, input.project_id),
+            _cached_fetch(("memberships", input.project_id),
+                          lambda: client.get_memberships(project_id=input.project_id)),
+            client.get_time_entries(filters=time_filters),
+        )
         logger.info(f"[get_report_data] Total work packages fetched: {len(all_work_packages)}")
         
         # Filter for relevant WPs (same logic as main function)
@@ -401,25 +463,7 @@ async def get_report_data(input: GetReportDataInput) -> str:
         logger.info(f"[get_report_data] Relevant work packages after filtering: {len(work_packages)}")
 
         
-        members_result = await client.get_memberships(project_id=input.project_id)
         members = members_result.get("_embedded", {}).get("elements", [])
-        
-        time_filters = json.dumps([
-            {
-                "spentOn": {
-                    "operator": "<>d",
-                    "values": [input.from_date, input.to_date]
-                }
-            },
-            {
-                "project": {
-                    "operator": "=",
-                    "values": [str(input.project_id)]
-                }
-            }
-        ])
-        
-        te_result = await client.get_time_entries(filters=time_filters)
         time_entries = te_result.get("_embedded", {}).get("elements", [])
         
         # Format as JSON
@@ -0,0 +1,109 @@
+"""Small TTL + LRU cache for read-tool responses.
+
+Repeated lookups of the same entity within seconds are common when an
+LLM drives the server (fetch, reason, fetch again). Serving those hits
+from memory removes a full API round-trip, which dwarfs every other
+per-call cost. Entries expire after a short TTL so writes done outside
+this process are picked up quickly, and writers in this process
+invalidate their keys explicitly.
+"""
+
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class AsyncTTLCache:
+    """Bounded cache with per-entry TTL and LRU eviction.
+
+    Safe for use from coroutines on one event loop: all operations are
+    synchronous dict work with no awaits, so they cannot interleave.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 30.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before LRU eviction
+            ttl: Seconds an entry stays valid after being stored
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None if absent/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entries if full."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop key from the cache if present (used after writes)."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+def cached(
+    ttl: float = 30.0,
+    maxsize: int = 128,
+    key_builder: Optional[Callable[..., Hashable]] = None,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+):
+    """Cache an async function's results in an AsyncTTLCache.
+
+    Decorator counterpart to the explicit get/set pattern, for functions
+    whose whole result can be reused as-is (e.g. formatted lookup-table
+    listings). The cache is exposed as ``wrapper.cache`` so writers can
+    invalidate or clear it.
+
+    Args:
+        ttl: Seconds a result stays valid
+        maxsize: Maximum number of cached results
+        key_builder: Maps the call arguments to a cache key; defaults to
+            the positional arguments plus sorted keyword items
+        should_cache: Predicate deciding whether a result is worth
+            keeping (e.g. skip error strings); defaults to caching all
+
+    Returns:
+        The decorator wrapping the async function
+    """
+
+    def decorator(func):
+        cache = AsyncTTLCache(maxsize=maxsize, ttl=ttl)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if key_builder is not None:
+                key = key_builder(*args, **kwargs)
+            else:
+                key = (args, tuple(sorted(kwargs.items())))
+
+            value = cache.get(key)
+            if value is None:
+                value = await func(*args, **kwargs)
+                if should_cache is None or should_cache(value):
+                    cache.set(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
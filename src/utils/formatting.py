@@ -1,7 +1,70 @@
 """Response formatting utilities for consistent output across all tools."""
 
+import json
+import types
 from typing import List, Dict, Any, Optional
 
+# Shared immutable default for absent _embedded blocks; a `{}` default
+# inside .get would allocate a fresh dict per element.
+EMPTY_MAPPING = types.MappingProxyType({})
+
+
+class SafeDict(dict):
+    """Mapping for format_map that renders missing keys as a placeholder.
+
+    Args:
+        mapping: Source mapping to copy
+        default: Text substituted for any missing key (default "N/A")
+    """
+
+    def __init__(self, mapping, default: str = "N/A"):
+        super().__init__(mapping)
+        self._default = default
+
+    def __missing__(self, key):
+        return self._default
+
+
+try:
+    import orjson
+
+    def compact_dumps(obj: Any) -> str:
+        """Serialize a filter/sort structure to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def compact_dumps(obj: Any) -> str:
+        """Serialize a filter/sort structure to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
+
+
+def eq_filter(field: str, value: Any) -> Dict:
+    """Build an equality clause for the OpenProject filter grammar.
+
+    Args:
+        field: Filter field name (e.g. "user", "status")
+        value: Value to match; coerced to str as the API expects
+
+    Returns:
+        Dict: One filter clause suitable for compact_dumps
+    """
+    return {field: {"operator": "=", "values": [str(value)]}}
+
+
+def op_filter(field: str, op: str, value: Any) -> Dict:
+    """Build a single-value clause with an explicit operator.
+
+    Args:
+        field: Filter field name (e.g. "spent_on", "name")
+        op: Filter operator (e.g. ">=", "<=", "~")
+        value: Value passed through unchanged
+
+    Returns:
+        Dict: One filter clause suitable for compact_dumps
+    """
+    return {field: {"operator": op, "values": [value]}}
+
 
 def format_project_list(projects: List[Dict]) -> str:
     """Format project list with consistent styling.
@@ -332,7 +395,7 @@ def format_news_list(news_items: List[Dict]) -> str:
         if created_at and created_at != 'Unknown':
             try:
                 created_date = created_at.split('T')[0]
-            except:
+            except AttributeError:
                 created_date = created_at
         else:
             created_date = created_at
@@ -385,7 +448,7 @@ def format_news_detail(news_item: Dict) -> str:
             created_date = created_at.split('T')[0]
             created_time = created_at.split('T')[1].split('.')[0] if 'T' in created_at else ''
             created_display = f"{created_date} {created_time}"
-        except:
+        except (AttributeError, IndexError):
             created_display = created_at
     else:
         created_display = created_at
@@ -178,7 +178,7 @@ def format_work_package_row(wp: Dict) -> str:
         try:
             updated_dt = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
             updated_date = updated_dt.strftime('%Y-%m-%d')
-        except:
+        except (ValueError, AttributeError):
             updated_date = 'N/A'
     else:
         updated_date = 'N/A'
@@ -0,0 +1,378 @@
+"""Test script for the async infrastructure behind the client and tools.
+
+Covers the pieces that have no HTTP server in the loop: the batching
+loader (src/client_loaders.py), the TTL/LRU cache and its decorator
+(src/utils/async_cache.py), the optimistic-locking PATCH retry, and the
+client-side grouping of the bulk membership/children queries. Everything
+runs against mocks, so no OpenProject instance is needed.
+
+Run: python test_async_infra.py
+"""
+
+import asyncio
+import sys
+from unittest.mock import AsyncMock
+
+from src.client import OpenProjectClient
+from src.client_loaders import AsyncBatchLoader
+from src.utils.async_cache import AsyncTTLCache, cached
+
+
+def _make_client() -> OpenProjectClient:
+    """Build a client that never talks to the network in these tests."""
+    return OpenProjectClient("http://localhost", "test-api-key")
+
+
+async def test_batch_loader():
+    """Test AsyncBatchLoader batching, dedup, and error propagation."""
+    print("=" * 70)
+    print("TEST 1: AsyncBatchLoader")
+    print("=" * 70)
+
+    try:
+        calls = []
+
+        async def fetch_many(keys):
+            calls.append(sorted(keys))
+            return {key: f"value-{key}" for key in keys if key != 99}
+
+        # 1.1: Concurrent loads inside one window coalesce into one fetch
+        print("\n[1.1] Testing window coalescing")
+        loader = AsyncBatchLoader(fetch_many, max_batch=50, max_wait_ms=5)
+        results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(3))
+        assert results == ["value-1", "value-2", "value-3"], f"Got: {results}"
+        assert calls == [[1, 2, 3]], f"Expected one batched fetch, got: {calls}"
+        print("✅ PASSED: 3 loads resolved by 1 batched fetch")
+
+        # 1.2: Duplicate keys share one future and appear once in the batch
+        print("\n[1.2] Testing duplicate key dedup")
+        calls.clear()
+        results = await asyncio.gather(loader.load(7), loader.load(7), loader.load(7))
+        assert results == ["value-7"] * 3, f"Got: {results}"
+        assert calls == [[7]], f"Expected key 7 fetched once, got: {calls}"
+        print("✅ PASSED: duplicate loads deduplicated to one key")
+
+        # 1.3: Hitting max_batch flushes without waiting for the window
+        print("\n[1.3] Testing max_batch flush")
+        calls.clear()
+        small = AsyncBatchLoader(fetch_many, max_batch=2, max_wait_ms=5000)
+        results = await asyncio.wait_for(
+            asyncio.gather(small.load(1), small.load(2)), timeout=1.0
+        )
+        assert results == ["value-1", "value-2"], f"Got: {results}"
+        assert calls == [[1, 2]], f"Got: {calls}"
+        print("✅ PASSED: full batch dispatched before the wait window closed")
+
+        # 1.4: Keys missing from the fetch result resolve to None
+        print("\n[1.4] Testing missing key")
+        result = await loader.load(99)
+        assert result is None, f"Expected None for missing key, got: {result}"
+        print("✅ PASSED: missing key resolved to None")
+
+        # 1.5: A failing fetch rejects every waiting load
+        print("\n[1.5] Testing error propagation")
+
+        async def failing_fetch(keys):
+            raise RuntimeError("backend down")
+
+        broken = AsyncBatchLoader(failing_fetch, max_batch=50, max_wait_ms=5)
+        results = await asyncio.gather(
+            broken.load(1), broken.load(2), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results), f"Got: {results}"
+        print("✅ PASSED: fetch error delivered to all waiters")
+
+        print("\n✅ All AsyncBatchLoader tests PASSED")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ FAILED: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+async def test_ttl_cache():
+    """Test AsyncTTLCache expiry, LRU eviction, and the cached decorator."""
+    print("\n" + "=" * 70)
+    print("TEST 2: AsyncTTLCache and @cached")
+    print("=" * 70)
+
+    try:
+        # 2.1: Basic set/get and invalidate
+        print("\n[2.1] Testing set/get/invalidate")
+        cache = AsyncTTLCache(maxsize=8, ttl=60)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache.get("absent") is None
+        cache.invalidate("key")
+        assert cache.get("key") is None
+        cache.invalidate("key")  # Invalidating an absent key is a no-op
+        print("✅ PASSED: set/get/invalidate behave correctly")
+
+        # 2.2: Entries expire after the TTL
+        print("\n[2.2] Testing TTL expiry")
+        cache = AsyncTTLCache(maxsize=8, ttl=0.05)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        await asyncio.sleep(0.1)
+        assert cache.get("key") is None, "Entry should have expired"
+        print("✅ PASSED: entry expired after TTL")
+
+        # 2.3: LRU eviction keeps recently used entries
+        print("\n[2.3] Testing LRU eviction")
+        cache = AsyncTTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # Touch "a" so "b" is the LRU entry
+        cache.set("c", 3)
+        assert cache.get("a") == 1, "Recently used entry was evicted"
+        assert cache.get("b") is None, "LRU entry should have been evicted"
+        assert cache.get("c") == 3
+        print("✅ PASSED: least recently used entry evicted first")
+
+        # 2.4: clear drops everything
+        print("\n[2.4] Testing clear")
+        cache.clear()
+        assert cache.get("a") is None and cache.get("c") is None
+        print("✅ PASSED: clear emptied the cache")
+
+        # 2.5: @cached serves repeat calls from memory
+        print("\n[2.5] Testing @cached hit/miss")
+        call_count = 0
+
+        @cached(ttl=60, should_cache=lambda text: text.startswith("✅"))
+        async def lookup(key: str) -> str:
+            nonlocal call_count
+            call_count += 1
+            return f"✅ {key}" if key != "bad" else "❌ Error"
+
+        assert await lookup("x") == "✅ x"
+        assert await lookup("x") == "✅ x"
+        assert call_count == 1, f"Expected 1 underlying call, got {call_count}"
+        print("✅ PASSED: second call served from cache")
+
+        # 2.6: should_cache keeps error results out of the cache
+        print("\n[2.6] Testing should_cache predicate")
+        assert await lookup("bad") == "❌ Error"
+        assert await lookup("bad") == "❌ Error"
+        assert call_count == 3, f"Error results must not be cached, got {call_count}"
+        print("✅ PASSED: error result re-computed every call")
+
+        # 2.7: wrapper.cache allows explicit invalidation
+        print("\n[2.7] Testing wrapper.cache invalidation")
+        lookup.cache.clear()
+        assert await lookup("x") == "✅ x"
+        assert call_count == 4, "Cleared cache should force a fresh call"
+        print("✅ PASSED: wrapper.cache.clear() forced a refresh")
+
+        print("\n✅ All cache tests PASSED")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ FAILED: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+async def test_patch_with_lock():
+    """Test the optimistic-locking PATCH retry on 409 conflicts."""
+    print("\n" + "=" * 70)
+    print("TEST 3: _patch_with_lock")
+    print("=" * 70)
+
+    try:
+        # 3.1: Without a known version the current one is fetched first
+        print("\n[3.1] Testing fetch-then-patch default path")
+        client = _make_client()
+        client._request = AsyncMock(return_value={"id": 1, "lockVersion": 4})
+        refetch = AsyncMock(return_value={"id": 1, "lockVersion": 3})
+
+        result = await client._patch_with_lock(
+            "/work_packages/1", {"subject": "New"}, refetch
+        )
+        assert result == {"id": 1, "lockVersion": 4}
+        assert client._request.await_count == 1
+        refetch.assert_awaited_once()
+        payload = client._request.await_args.args[2]
+        assert payload["lockVersion"] == 3, f"Got: {payload}"
+        print("✅ PASSED: one refetch seeded the lockVersion, one PATCH")
+
+        # 3.2: A 409 race triggers a second refetch and one retry
+        print("\n[3.2] Testing 409 retry")
+        client = _make_client()
+        client._request = AsyncMock(
+            side_effect=[
+                Exception("API Error 409: Conflict"),
+                {"id": 1, "lockVersion": 8},
+            ]
+        )
+        refetch = AsyncMock(
+            side_effect=[{"id": 1, "lockVersion": 6}, {"id": 1, "lockVersion": 7}]
+        )
+
+        payload = {"subject": "New"}
+        result = await client._patch_with_lock("/work_packages/1", payload, refetch)
+        assert result == {"id": 1, "lockVersion": 8}
+        assert client._request.await_count == 2
+        assert refetch.await_count == 2
+        assert payload["lockVersion"] == 7, f"Retry must use refetched version: {payload}"
+        print("✅ PASSED: refreshed lockVersion used for the retry")
+
+        # 3.3: Non-409 errors propagate without a retry
+        print("\n[3.3] Testing non-409 error")
+        client = _make_client()
+        client._request = AsyncMock(side_effect=Exception("API Error 500: boom"))
+        refetch = AsyncMock(return_value={"id": 1, "lockVersion": 2})
+
+        try:
+            await client._patch_with_lock("/work_packages/1", {}, refetch)
+            raise AssertionError("Expected the 500 to propagate")
+        except Exception as e:
+            assert "API Error 500" in str(e), f"Got: {e}"
+        refetch.assert_awaited_once()
+        assert client._request.await_count == 1
+        print("✅ PASSED: non-409 error raised without retry")
+
+        # 3.4: A caller-supplied lock_version skips the initial refetch
+        print("\n[3.4] Testing explicit lock_version")
+        client = _make_client()
+        client._request = AsyncMock(return_value={"id": 1})
+        refetch = AsyncMock()
+        payload = {"subject": "New"}
+        await client._patch_with_lock(
+            "/work_packages/1", payload, refetch, lock_version=5
+        )
+        assert payload["lockVersion"] == 5, f"Got: {payload}"
+        refetch.assert_not_awaited()
+        assert client._request.await_count == 1
+        print("✅ PASSED: explicit lock_version sent with a single round-trip")
+
+        print("\n✅ All _patch_with_lock tests PASSED")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ FAILED: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+async def test_bulk_grouping():
+    """Test client-side grouping of the bulk membership/children queries."""
+    print("\n" + "=" * 70)
+    print("TEST 4: Bulk query grouping")
+    print("=" * 70)
+
+    try:
+        # 4.1: Memberships grouped by principal href, all ids get a key
+        print("\n[4.1] Testing get_memberships_bulk grouping")
+        client = _make_client()
+        client._request = AsyncMock(
+            return_value={
+                "_embedded": {
+                    "elements": [
+                        {"id": 1, "_links": {"principal": {"href": "/api/v3/users/7"}}},
+                        {"id": 2, "_links": {"principal": {"href": "/api/v3/users/7"}}},
+                        {"id": 3, "_links": {"principal": {"href": "/api/v3/users/9"}}},
+                        {"id": 4, "_links": {"principal": {"href": "/api/v3/groups/x"}}},
+                        {"id": 5, "_links": {}},
+                    ]
+                }
+            }
+        )
+
+        grouped = await client.get_memberships_bulk([7, 9, 11])
+        assert sorted(grouped) == [7, 9, 11], f"Got keys: {sorted(grouped)}"
+        assert [m["id"] for m in grouped[7]] == [1, 2], f"Got: {grouped[7]}"
+        assert [m["id"] for m in grouped[9]] == [3], f"Got: {grouped[9]}"
+        assert grouped[11] == [], "Users without memberships need an empty key"
+        print("✅ PASSED: elements grouped per user, malformed hrefs skipped")
+
+        # 4.2: The filter carries every requested id in one request
+        print("\n[4.2] Testing single multi-value request")
+        assert client._request.await_count == 1
+        params = client._request.await_args.kwargs["params"]
+        assert '"7"' in params["filters"] and '"11"' in params["filters"]
+        print("✅ PASSED: one request with a multi-value principal filter")
+
+        # 4.3: Children grouped by parent href, all parents get a key
+        print("\n[4.3] Testing list_work_package_children_bulk grouping")
+        client = _make_client()
+        client._request = AsyncMock(
+            return_value={
+                "_embedded": {
+                    "elements": [
+                        {"id": 10, "_links": {"parent": {"href": "/api/v3/work_packages/1"}}},
+                        {"id": 11, "_links": {"parent": {"href": "/api/v3/work_packages/2"}}},
+                        {"id": 12, "_links": {"parent": {"href": "/api/v3/work_packages/1"}}},
+                        {"id": 13, "_links": {"parent": {"href": "/api/v3/work_packages/abc"}}},
+                    ]
+                }
+            }
+        )
+
+        children = await client.list_work_package_children_bulk([1, 2, 3])
+        assert sorted(children) == [1, 2, 3], f"Got keys: {sorted(children)}"
+        assert [c["id"] for c in children[1]] == [10, 12], f"Got: {children[1]}"
+        assert [c["id"] for c in children[2]] == [11], f"Got: {children[2]}"
+        assert children[3] == [], "Childless parents need an empty key"
+        assert client._request.await_count == 1
+        print("✅ PASSED: children grouped per parent in one request")
+
+        print("\n✅ All bulk grouping tests PASSED")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ FAILED: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+async def run_all_tests():
+    """Run all async infrastructure tests."""
+    print("\n" + "=" * 70)
+    print("ASYNC INFRASTRUCTURE TEST SUITE")
+    print("=" * 70)
+
+    results = []
+    results.append(("AsyncBatchLoader", await test_batch_loader()))
+    results.append(("AsyncTTLCache", await test_ttl_cache()))
+    results.append(("_patch_with_lock", await test_patch_with_lock()))
+    results.append(("Bulk grouping", await test_bulk_grouping()))
+
+    print("\n" + "=" * 70)
+    print("TEST SUMMARY")
+    print("=" * 70)
+
+    for name, passed in results:
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        print(f"{name}: {status}")
+
+    total = len(results)
+    passed_count = sum(1 for _, passed in results if passed)
+
+    print("\n" + "=" * 70)
+    print(f"Total: {passed_count}/{total} test suites passed")
+    print("=" * 70)
+
+    return passed_count == total
+
+
+if __name__ == "__main__":
+    success = asyncio.run(run_all_tests())
+    sys.exit(0 if success else 1)
@@ -175,11 +175,14 @@ def test_server_integration():
         with open("src/server.py", "r", encoding="utf-8") as f:
             content = f.read()
         
-        # Check for news import
-        if "from src.tools import news" in content:
+        # Check that news is registered (tool modules are listed in
+        # TOOL_MODULES and imported via importlib)
+        if '"news"' in content and "importlib.import_module" in content:
+            print("  ✅ News registered in server.py TOOL_MODULES")
+        elif "from src.tools import news" in content:
             print("  ✅ News import found in server.py")
         else:
-            print("  ❌ News import missing in server.py")
+            print("  ❌ News registration missing in server.py")
             return False
         
         # Check for updated tool count